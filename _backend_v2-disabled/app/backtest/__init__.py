@@ -2,16 +2,27 @@
 CapSight Backtesting Subsystem
 Counterfactual replay and model evaluation infrastructure
 """
+from importlib import import_module
+
 from .config import BacktestConfig
-from .replay import BacktestReplay
-from .metrics import BacktestMetrics
-from .uplift import UpliftAnalyzer
-from .reports.renderer import ReportRenderer
+
+_LAZY_EXPORTS = {
+    'ReplayEngine': '.replay',
+    'MetricsCalculator': '.metrics',
+    'UpliftAnalyzer': '.uplift',
+    'ReportRenderer': '.reports.renderer'
+}
+
+def __getattr__(name: str):
+    # Engines load on first access, so importing one submodule does not pull in the rest
+    if name in _LAZY_EXPORTS:
+        return getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'BacktestConfig',
-    'BacktestReplay', 
-    'BacktestMetrics',
+    'ReplayEngine',
+    'MetricsCalculator',
     'UpliftAnalyzer',
     'ReportRenderer'
 ]
@@ -3,7 +3,7 @@ FastAPI routes for backtest endpoints
 Provides REST API for backtest operations
 """
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Path, Body
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from typing import List, Dict, Any, Optional
 from datetime import datetime, date
 from pydantic import BaseModel, Field
@@ -33,7 +33,11 @@ from ..jobs.scheduler import job_scheduler
 logger = logging.getLogger(__name__)
 
 # Create router
-router = APIRouter(prefix="/api/v1/backtest", tags=["backtest"])
+router = APIRouter(
+    prefix="/api/v1/backtest",
+    tags=["backtest"],
+    default_response_class=ORJSONResponse
+)
 
 # Dependencies
 async def get_data_access() -> BacktestDataAccess:
@@ -102,7 +106,7 @@ async def create_backtest_run(
             status="running",
             config={
                 "user_id": current_user.get("user_id"),
-                "api_request": request.dict(),
+                "api_request": request.model_dump(),
                 "training_window": {
                     "start": time_window.train_start.isoformat(),
                     "end": time_window.train_end.isoformat()
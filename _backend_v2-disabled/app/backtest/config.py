@@ -1,7 +1,8 @@
 """
 Backtesting configuration and constants
 """
-from pydantic import BaseSettings, Field
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import os
@@ -10,9 +11,9 @@ class BacktestConfig(BaseSettings):
     """Configuration for backtesting subsystem"""
     
     # Data access
-    feast_repo_path: str = Field(default=".", env="FEAST_REPO_PATH")
-    redis_url: str = Field(default="redis://localhost:6379", env="REDIS_URL")
-    mlflow_tracking_uri: str = Field(default="http://localhost:5000", env="MLFLOW_TRACKING_URI")
+    feast_repo_path: str = Field(default=".", validation_alias="FEAST_REPO_PATH")
+    redis_url: str = Field(default="redis://localhost:6379", validation_alias="REDIS_URL")
+    mlflow_tracking_uri: str = Field(default="http://localhost:5000", validation_alias="MLFLOW_TRACKING_URI")
     
     # Backtest parameters
     default_horizon_months: int = Field(default=6, description="Default forecast horizon")
@@ -31,6 +32,13 @@ class BacktestConfig(BaseSettings):
     max_sample_size: int = Field(default=10000, description="Max properties per backtest")
     batch_size: int = Field(default=100, description="Batch size for predictions")
     max_concurrent_requests: int = Field(default=5, description="Max concurrent API calls")
+    max_cohort_concurrency: int = Field(default=4, description="Max cohorts analyzed concurrently")
+    
+    # Statistical testing
+    statistical_significance_level: float = Field(default=0.05, description="p-value cutoff for uplift significance")
+    default_prediction_thresholds: Dict[str, float] = Field(default={
+        "investment_success": 0.5,
+    }, description="Score cutoffs that turn probabilities into decisions")
     
     # SLA thresholds
     accuracy_sla_threshold: float = Field(default=0.942, description="94.2% accuracy SLA")
@@ -39,7 +47,7 @@ class BacktestConfig(BaseSettings):
     response_time_sla_ms: int = Field(default=100, description="100ms response time SLA")
     
     # Report generation
-    report_output_dir: str = Field(default="./backtest_reports", env="BACKTEST_REPORT_DIR")
+    report_output_dir: str = Field(default="./backtest_reports", validation_alias="BACKTEST_REPORT_DIR")
     enable_pdf_generation: bool = Field(default=True, description="Enable PDF report generation")
     
     # Asset types and markets
@@ -53,11 +61,11 @@ class BacktestConfig(BaseSettings):
     ])
     
     # Database
-    database_url: str = Field(..., env="DATABASE_URL")
+    database_url: str = Field(..., validation_alias="DATABASE_URL")
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env", case_sensitive=False, populate_by_name=True, extra="ignore"
+    )
 
 # Global config instance
 config = BacktestConfig()
@@ -339,7 +339,7 @@ class BacktestDataAccess:
             await session.execute(query, (
                 uuid.uuid4(),
                 run_id,
-                json.dumps(metrics.dict()),
+                metrics.model_dump_json(),
                 datetime.utcnow()
             ))
             
@@ -354,7 +354,7 @@ class BacktestDataAccess:
             if not result:
                 return None
             
-            return BacktestMetrics(**json.loads(result['json_blob']))
+            return BacktestMetrics.model_validate_json(result['json_blob'])
     
     # Prediction Snapshots (Audit Trail)
     async def store_prediction_snapshot(
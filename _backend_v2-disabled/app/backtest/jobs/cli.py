@@ -635,6 +635,8 @@ async def main():
         logger.error(f"Unexpected error: {e}")
         print(f"FATAL ERROR: {e}")
         sys.exit(1)
+    finally:
+        uplift_analyzer.close()
 
 if __name__ == '__main__':
     # Import numpy here to avoid issues with CLI parsing
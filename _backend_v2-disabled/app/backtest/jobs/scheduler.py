@@ -34,6 +34,7 @@ from ..feature_loader import FeatureLoader, feature_loader
 from ..replay import ReplayEngine, replay_engine
 from ..metrics import MetricsCalculator, metrics_calculator
 from ..reports.renderer import ReportRenderer, report_renderer
+from ..uplift import shutdown_bootstrap_pool
 
 class JobStatus(Enum):
     """Status of scheduled jobs"""
@@ -119,6 +120,9 @@ class BacktestJobScheduler:
             if not task.done():
                 task.cancel()
                 self.logger.info(f"Cancelled job {job_id}")
+        
+        # Release uplift bootstrap workers without blocking the event loop
+        await asyncio.to_thread(shutdown_bootstrap_pool)
     
     async def schedule_recurring_backtest(
         self,
@@ -9,17 +9,55 @@ import pandas as pd
 import numpy as np
 from dataclasses import dataclass
 from sklearn.metrics import (
-    accuracy_score, precision_score, recall_score, f1_score,
     roc_auc_score, precision_recall_curve, roc_curve,
     mean_squared_error, mean_absolute_error, r2_score
 )
 import warnings
 warnings.filterwarnings("ignore")
 
+# Numba JIT for fused metric kernels
+try:
+    from numba import njit
+except ImportError:
+    # Fall back to plain Python when numba is unavailable
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 from .config import config
 from .schemas import BacktestResult, MetricsSummary, PredictionSnapshot
 from .data_access import BacktestDataAccess
 
+@njit(cache=True, fastmath=True)
+def _fused_binary_metrics(y_true, y_score, threshold):
+    """Confusion counts (tp, fp, tn, fn) in a single pass over the arrays"""
+    tp = 0
+    fp = 0
+    fn = 0
+    n = y_true.shape[0]
+    for i in range(n):
+        actual = 1 if y_true[i] != 0 else 0
+        predicted = 1 if y_score[i] >= threshold else 0
+        tp += actual & predicted
+        fp += (1 - actual) & predicted
+        fn += actual & (1 - predicted)
+    return tp, fp, n - tp - fp - fn, fn
+
+def _binary_metrics_from_counts(tp: int, fp: int, tn: int, fn: int) -> Dict[str, float]:
+    """Accuracy/precision/recall/F1 from confusion counts (zero_division=0)"""
+    total = tp + fp + tn + fn
+    accuracy = (tp + tn) / total if total else 0.0
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "accuracy": float(accuracy),
+        "precision": float(precision),
+        "recall": float(recall),
+        "f1_score": float(f1)
+    }
+
 @dataclass
 class ClassificationMetrics:
     """Standard classification metrics"""
@@ -118,6 +156,26 @@ class MetricsCalculator:
             cohort_metrics=cohort_metrics
         )
     
+    def calculate_ml_metrics(
+        self,
+        y_true: np.ndarray,
+        y_score: np.ndarray,
+        threshold: float = 0.5
+    ) -> Dict[str, float]:
+        """Binary classification metrics from labels and scores/probabilities"""
+        y_true = np.ascontiguousarray(y_true, dtype=np.float32)
+        y_score = np.ascontiguousarray(y_score, dtype=np.float32)
+        
+        tp, fp, tn, fn = _fused_binary_metrics(y_true, y_score, np.float32(threshold))
+        metrics = _binary_metrics_from_counts(tp, fp, tn, fn)
+        
+        try:
+            metrics["roc_auc"] = float(roc_auc_score(y_true, y_score))
+        except ValueError:
+            metrics["roc_auc"] = 0.5  # Single class present
+        
+        return metrics
+    
     def _predictions_to_dataframe(self, predictions: List[PredictionSnapshot]) -> pd.DataFrame:
         """Convert prediction snapshots to DataFrame"""
         
@@ -215,11 +273,13 @@ class MetricsCalculator:
             threshold = self.default_thresholds.get("investment_success", 0.5)
             y_pred = (df.get("positive_class_prob", df.get("proba", 0.5)) >= threshold).astype(int)
         
-        # Calculate basic metrics
-        accuracy = accuracy_score(y_true, y_pred)
-        precision = precision_score(y_true, y_pred, zero_division=0)
-        recall = recall_score(y_true, y_pred, zero_division=0)
-        f1 = f1_score(y_true, y_pred, zero_division=0)
+        # Confusion counts and basic metrics in one fused pass
+        tp, fp, tn, fn = _fused_binary_metrics(
+            np.ascontiguousarray(y_true, dtype=np.float32),
+            np.ascontiguousarray(y_pred, dtype=np.float32),
+            np.float32(0.5)
+        )
+        basic = _binary_metrics_from_counts(tp, fp, tn, fn)
         
         # ROC AUC (requires probabilities)
         roc_auc = 0.5
@@ -230,12 +290,6 @@ class MetricsCalculator:
             except ValueError:
                 roc_auc = 0.5  # No discrimination
         
-        # Confusion matrix
-        tn = ((y_true == 0) & (y_pred == 0)).sum()
-        fp = ((y_true == 0) & (y_pred == 1)).sum()
-        fn = ((y_true == 1) & (y_pred == 0)).sum()
-        tp = ((y_true == 1) & (y_pred == 1)).sum()
-        
         confusion_matrix = {
             "true_negative": int(tn),
             "false_positive": int(fp),
@@ -244,10 +298,10 @@ class MetricsCalculator:
         }
         
         return ClassificationMetrics(
-            accuracy=float(accuracy),
-            precision=float(precision),
-            recall=float(recall),
-            f1_score=float(f1),
+            accuracy=basic["accuracy"],
+            precision=basic["precision"],
+            recall=basic["recall"],
+            f1_score=basic["f1_score"],
             roc_auc=float(roc_auc),
             confusion_matrix=confusion_matrix
         )
@@ -359,7 +359,7 @@ class BacktestPipeline:
                 'title': f'Backtest Report - {self.config.name}',
                 'run_id': run_id,
                 'model_version': self.config.model_version,
-                'config': self.config.dict(),
+                'config': self.config.model_dump(),
                 'metrics': metrics,
                 'summary': {
                     'total_predictions': len(results),
@@ -4,13 +4,14 @@ Generates PDF, HTML, and Markdown reports with charts and analysis
 """
 import asyncio
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Union, IO
 import pandas as pd
 import numpy as np
 from pathlib import Path
 import json
 import base64
-from io import BytesIO
+from html import escape
+from io import BytesIO, TextIOBase
 import tempfile
 
 # Jinja2 for templating
@@ -39,15 +40,18 @@ except ImportError:
     class HTML: pass
     class CSS: pass
 
-from .config import config
-from .schemas import BacktestRun, BacktestResult, MetricsSummary
-from .data_access import BacktestDataAccess
-from .metrics import MetricsCalculator, PerformanceMetrics
-from .uplift import UpliftAnalyzer
+from ..config import config
+from ..schemas import BacktestRunDB, BacktestResult, MetricsSummary
+from ..data_access import BacktestDataAccess
+from ..metrics import MetricsCalculator, PerformanceMetrics
+from ..uplift import UpliftAnalyzer
 
 class ReportRenderer:
     """Generates comprehensive backtest reports in multiple formats"""
     
+    # Jinja environments shared across instances, keyed by template directory
+    _ENV: Dict[str, Any] = {}
+    
     def __init__(
         self,
         data_access: Optional[BacktestDataAccess] = None,
@@ -63,14 +67,23 @@ class ReportRenderer:
         self.template_dir = template_dir or str(Path(__file__).parent / "templates")
         self._ensure_template_dir()
         
-        try:
-            self.jinja_env = Environment(
-                loader=FileSystemLoader(self.template_dir),
-                autoescape=True
-            )
-        except:
-            self.jinja_env = None
-            print("Warning: Jinja2 template engine not available")
+        self.jinja_env = self._get_jinja_env(self.template_dir)
+    
+    @classmethod
+    def _get_jinja_env(cls, template_dir: str):
+        """Lazily build one Jinja environment per template directory"""
+        if template_dir not in cls._ENV:
+            try:
+                cls._ENV[template_dir] = Environment(
+                    loader=FileSystemLoader(template_dir),
+                    autoescape=True,
+                    cache_size=-1,
+                    auto_reload=False
+                )
+            except:
+                print("Warning: Jinja2 template engine not available")
+                return None
+        return cls._ENV[template_dir]
     
     def _ensure_template_dir(self):
         """Ensure template directory exists"""
@@ -358,7 +371,7 @@ class ReportRenderer:
         include_charts: bool = True,
         include_uplift: bool = True,
         include_sample_predictions: bool = True,
-        output_path: Optional[str] = None
+        output_path: Optional[Union[str, IO]] = None
     ) -> str:
         """
         Generate comprehensive backtest report
@@ -369,7 +382,7 @@ class ReportRenderer:
             include_charts: Whether to include performance charts
             include_uplift: Whether to include uplift analysis
             include_sample_predictions: Whether to include prediction samples
-            output_path: Path to save report (optional)
+            output_path: Path or writable file-like object to save report (binary for pdf, optional)
             
         Returns:
             Report content as string or path to saved file
@@ -429,20 +442,108 @@ class ReportRenderer:
         else:
             raise ValueError(f"Unsupported format: {output_format}")
         
-        # Save to file if path provided
-        if output_path:
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            if output_format == "pdf":
-                output_path.write_bytes(content)
-            else:
-                output_path.write_text(content)
-            
+        # Write into a file-like object directly, or save to file if path provided
+        if hasattr(output_path, "write"):
+            self._write_report(content, output_path)
+        elif output_path:
+            self._write_report(content, output_path)
             return str(output_path)
         
         return content if output_format != "pdf" else base64.b64encode(content).decode()
     
+    def render_html_report(self, data: Dict[str, Any], output: Union[str, Path, IO]) -> bool:
+        """
+        Render a standalone HTML report from plain report data
+        
+        Args:
+            data: Report data with a "title", optional "summary" metrics and "sections"
+            output: Path or writable text file-like object
+            
+        Returns:
+            True once the report has been written
+        """
+        title = escape(str(data.get("title", "Backtest Report")))
+        lines = [
+            "<!DOCTYPE html>",
+            "<html>",
+            f"<head><title>{title}</title></head>",
+            "<body>",
+            f"<h1>{title}</h1>"
+        ]
+        
+        summary = data.get("summary") or {}
+        if summary:
+            lines.append("<h2>Summary</h2>")
+            lines.append("<ul>")
+            for name, value in summary.items():
+                lines.append(
+                    f"<li><strong>{escape(self._summary_label(name))}:</strong> "
+                    f"{escape(self._summary_value(value))}</li>"
+                )
+            lines.append("</ul>")
+        
+        for section in data.get("sections", []):
+            lines.append(f"<h2>{escape(str(section.get('title', '')))}</h2>")
+            lines.append(f"<p>{escape(str(section.get('content', '')))}</p>")
+        
+        lines.extend(["</body>", "</html>"])
+        self._write_report("\n".join(lines) + "\n", output)
+        return True
+    
+    def render_markdown_report(self, data: Dict[str, Any], output: Union[str, Path, IO]) -> bool:
+        """
+        Render a standalone Markdown report from plain report data
+        
+        Args:
+            data: Report data with a "title", optional "summary" metrics and "sections"
+            output: Path or writable text file-like object
+            
+        Returns:
+            True once the report has been written
+        """
+        lines = [f"# {data.get('title', 'Backtest Report')}", ""]
+        
+        summary = data.get("summary") or {}
+        if summary:
+            lines.extend(["## Summary", ""])
+            for name, value in summary.items():
+                lines.append(f"- **{self._summary_label(name)}:** {self._summary_value(value)}")
+            lines.append("")
+        
+        for section in data.get("sections", []):
+            lines.extend([f"## {section.get('title', '')}", "", str(section.get("content", "")), ""])
+        
+        self._write_report("\n".join(lines), output)
+        return True
+    
+    @staticmethod
+    def _summary_label(name: str) -> str:
+        """Display label for a summary metric key"""
+        return name.replace("_", " ").title()
+    
+    @staticmethod
+    def _summary_value(value: Any) -> str:
+        """Display text for a summary metric value"""
+        if isinstance(value, float):
+            return f"{value:.4f}"
+        return str(value)
+    
+    @staticmethod
+    def _write_report(content: Union[str, bytes], output: Union[str, Path, IO]) -> None:
+        """Write report content into a file-like object, or to a path"""
+        if hasattr(output, "write"):
+            if isinstance(content, bytes) and isinstance(output, TextIOBase):
+                raise TypeError("PDF reports need a binary file-like object, not a text stream")
+            output.write(content)
+            return
+        
+        path = Path(output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, bytes):
+            path.write_bytes(content)
+        else:
+            path.write_text(content)
+    
     async def _render_html_report(self, context: Dict[str, Any]) -> str:
         """Render HTML report using template"""
         
@@ -505,7 +606,7 @@ This is a basic report for run {run.run_id}.
     
     async def _check_sla_compliance(
         self,
-        run: BacktestRun,
+        run: BacktestRunDB,
         metrics: PerformanceMetrics
     ) -> List[Dict[str, Any]]:
         """Check SLA compliance for the run"""
@@ -544,7 +645,7 @@ This is a basic report for run {run.run_id}.
         
         return sla_checks
     
-    def _calculate_runtime_minutes(self, run: BacktestRun) -> float:
+    def _calculate_runtime_minutes(self, run: BacktestRunDB) -> float:
         """Calculate runtime in minutes"""
         # Mock calculation - in production would use actual timestamps
         return 15.5  # Assume 15.5 minutes
@@ -1,12 +1,15 @@
 """
 Pydantic schemas for backtesting API and data structures
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime, date
 from enum import Enum
+from dataclasses import dataclass
 import uuid
 
+import numpy as np
+
 class BacktestStatus(str, Enum):
     PENDING = "pending"
     RUNNING = "running"
@@ -48,24 +51,20 @@ class BacktestRunRequest(BaseModel):
     scenario_params: Optional[Dict[str, Any]] = Field(default=None, description="Scenario parameters for what-if replay")
     notes: Optional[str] = Field(default=None, max_length=1000, description="Optional run description")
     
-    @validator("end_date")
-    def end_after_start(cls, v, values):
-        if "start_date" in values and v <= values["start_date"]:
+    @field_validator("end_date")
+    @classmethod
+    def end_after_start(cls, v, info: ValidationInfo):
+        start_date = info.data.get("start_date")
+        if start_date is not None and v <= start_date:
             raise ValueError("end_date must be after start_date")
         return v
-    
-    @validator("sample_size")
-    def reasonable_sample_size(cls, v):
-        if v > 10000:
-            raise ValueError("sample_size cannot exceed 10,000")
-        return v
 
 class BacktestRunResponse(BaseModel):
     """Response for backtest run creation"""
     run_id: uuid.UUID
     status: BacktestStatus
     created_at: datetime
-    estimated_completion_time: Optional[datetime]
+    estimated_completion_time: Optional[datetime] = None
     message: str
 
 class BacktestRunStatus(BaseModel):
@@ -73,14 +72,14 @@ class BacktestRunStatus(BaseModel):
     run_id: uuid.UUID
     status: BacktestStatus
     progress_pct: float = Field(ge=0, le=100, description="Completion percentage")
-    started_at: Optional[datetime]
-    ended_at: Optional[datetime]
-    total_properties: Optional[int]
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+    total_properties: Optional[int] = None
     processed_properties: int = 0
     failed_properties: int = 0
-    current_asof_date: Optional[date]
-    notes: Optional[str]
-    error_message: Optional[str]
+    current_asof_date: Optional[date] = None
+    notes: Optional[str] = None
+    error_message: Optional[str] = None
 
 # Result schemas
 class BacktestResult(BaseModel):
@@ -102,12 +101,12 @@ class BacktestResult(BaseModel):
     decile_rank: int = Field(ge=1, le=10)
     
     # Actuals (if available)
-    y_true_noi: Optional[float]
-    y_true_caprate_bps: Optional[float]
+    y_true_noi: Optional[float] = None
+    y_true_caprate_bps: Optional[float] = None
     
     # Computed metrics
-    noi_mape: Optional[float]
-    caprate_mae_bps: Optional[float]
+    noi_mape: Optional[float] = None
+    caprate_mae_bps: Optional[float] = None
     
     # Metadata
     model_name: str
@@ -119,6 +118,9 @@ class BacktestResult(BaseModel):
 
 class BacktestMetrics(BaseModel):
     """Aggregate metrics for a backtest run"""
+    # Emit inf/nan as JSON constants so model_dump_json stays in pydantic-core
+    model_config = ConfigDict(ser_json_inf_nan="constants")
+    
     run_id: uuid.UUID
     
     # Core accuracy metrics
@@ -141,7 +143,7 @@ class BacktestMetrics(BaseModel):
     total_properties: int
     successful_predictions: int
     failed_predictions: int
-    uplift_vs_baseline_pct: Optional[float]
+    uplift_vs_baseline_pct: Optional[float] = None
     
     # SLA compliance
     sla_targets_met: Dict[str, bool]
@@ -153,6 +155,14 @@ class BacktestMetrics(BaseModel):
     
     computed_at: datetime
 
+class MetricsSummary(BaseModel):
+    """Stored summary of the metrics computed for a run"""
+    summary_id: str
+    backtest_run_id: str
+    metrics_data: Dict[str, Any]
+    sla_breaches: List[str] = Field(default_factory=list)
+    created_at: datetime
+
 class PredictionSnapshot(BaseModel):
     """Snapshot of prediction for audit trail"""
     id: uuid.UUID
@@ -166,8 +176,8 @@ class PredictionSnapshot(BaseModel):
 class ReportRequest(BaseModel):
     """Request for report generation"""
     run_id: uuid.UUID
-    report_type: str = Field(default="accuracy_proof", regex="^(summary|executive|accuracy_proof|calibration|uplift)$")
-    format: str = Field(default="html", regex="^(html|pdf|markdown)$")
+    report_type: str = Field(default="accuracy_proof", pattern="^(summary|executive|accuracy_proof|calibration|uplift)$")
+    format: str = Field(default="html", pattern="^(html|pdf|markdown)$")
     include_charts: bool = True
     include_raw_data: bool = False
 
@@ -177,7 +187,7 @@ class ReportResponse(BaseModel):
     report_type: str
     format: str
     generated_at: datetime
-    expires_at: Optional[datetime]
+    expires_at: Optional[datetime] = None
 
 # What-if scenario schemas
 class ScenarioParameter(BaseModel):
@@ -200,39 +210,40 @@ class WhatIfScenario(BaseModel):
 # Database model schemas (for ORM)
 class BacktestRunDB(BaseModel):
     """Database model for backtest_runs table"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: uuid.UUID
-    started_at: Optional[datetime]
-    ended_at: Optional[datetime]
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
     status: BacktestStatus
     horizon_months: int
     sample_size: int
-    markets_filter: Optional[List[str]]
-    asset_types_filter: Optional[List[str]]
-    scenario_label: Optional[str]
-    scenario_params: Optional[Dict[str, Any]]
-    notes: Optional[str]
-    total_properties: Optional[int]
+    markets_filter: Optional[List[str]] = None
+    asset_types_filter: Optional[List[str]] = None
+    scenario_label: Optional[str] = None
+    scenario_params: Optional[Dict[str, Any]] = None
+    notes: Optional[str] = None
+    total_properties: Optional[int] = None
     processed_properties: int = 0
     failed_properties: int = 0
     created_at: datetime
 
-    class Config:
-        orm_mode = True
-
 class BacktestResultDB(BaseModel):
     """Database model for backtest_results table"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: uuid.UUID
     run_id: uuid.UUID
     asof_date: date
     property_id: str
     market: str
     asset_type: str
-    y_true_noi: Optional[float]
+    y_true_noi: Optional[float] = None
     y_pred_noi: float
-    noi_mape: Optional[float]
-    y_true_caprate_bps: Optional[float]
+    noi_mape: Optional[float] = None
+    y_true_caprate_bps: Optional[float] = None
     y_pred_caprate_bps: float
-    caprate_mae_bps: Optional[float]
+    caprate_mae_bps: Optional[float] = None
     arbitrage_score: float
     decile_rank: int
     confidence: float
@@ -245,5 +256,100 @@ class BacktestResultDB(BaseModel):
     feature_fingerprint: str
     created_at: datetime
 
-    class Config:
-        orm_mode = True
+# Bulk analytics (struct-of-arrays) representation
+_RESULT_FLOAT_FIELDS = (
+    "y_true_noi", "y_pred_noi", "noi_mape",
+    "y_true_caprate_bps", "y_pred_caprate_bps", "caprate_mae_bps",
+    "arbitrage_score", "confidence", "interval_lower", "interval_upper",
+)
+
+_RESULT_OBJECT_FIELDS = (
+    "id", "run_id", "asof_date", "property_id", "market", "asset_type",
+    "model_name", "model_version", "training_data_cutoff",
+    "data_sources", "feature_fingerprint", "created_at",
+)
+
+@dataclass
+class BacktestResultsFrame:
+    """Column-oriented view of backtest_results rows for bulk analytics
+    
+    Numeric fields are packed into parallel float32 arrays (NaN where the
+    row value is None) so aggregate metrics run vectorized instead of
+    per-row. Convert back with to_models() at the API boundary.
+    """
+    id: np.ndarray
+    run_id: np.ndarray
+    asof_date: np.ndarray
+    property_id: np.ndarray
+    market: np.ndarray
+    asset_type: np.ndarray
+    y_true_noi: np.ndarray
+    y_pred_noi: np.ndarray
+    noi_mape: np.ndarray
+    y_true_caprate_bps: np.ndarray
+    y_pred_caprate_bps: np.ndarray
+    caprate_mae_bps: np.ndarray
+    arbitrage_score: np.ndarray
+    decile_rank: np.ndarray
+    confidence: np.ndarray
+    interval_lower: np.ndarray
+    interval_upper: np.ndarray
+    model_name: np.ndarray
+    model_version: np.ndarray
+    training_data_cutoff: np.ndarray
+    data_sources: np.ndarray
+    feature_fingerprint: np.ndarray
+    created_at: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.property_id)
+    
+    @classmethod
+    def from_rows(cls, rows: List[BacktestResultDB]) -> "BacktestResultsFrame":
+        """Pack a list of result rows into column arrays"""
+        n = len(rows)
+        columns: Dict[str, np.ndarray] = {}
+        
+        for name in _RESULT_FLOAT_FIELDS:
+            # None becomes NaN when cast to a float dtype
+            columns[name] = np.array([getattr(row, name) for row in rows], dtype=np.float32)
+        
+        for name in _RESULT_OBJECT_FIELDS:
+            # Fill element-wise so list values (data_sources) stay scalar cells
+            column = np.empty(n, dtype=object)
+            for i, row in enumerate(rows):
+                column[i] = getattr(row, name)
+            columns[name] = column
+        
+        columns["decile_rank"] = np.fromiter(
+            (row.decile_rank for row in rows), dtype=np.int8, count=n
+        )
+        return cls(**columns)
+    
+    def to_models(self) -> List[BacktestResultDB]:
+        """Rebuild BacktestResultDB rows (floats come back at float32 precision)"""
+        models = []
+        for i in range(len(self)):
+            values: Dict[str, Any] = {name: getattr(self, name)[i] for name in _RESULT_OBJECT_FIELDS}
+            for name in _RESULT_FLOAT_FIELDS:
+                value = float(getattr(self, name)[i])
+                values[name] = None if np.isnan(value) else value
+            values["decile_rank"] = int(self.decile_rank[i])
+            models.append(BacktestResultDB(**values))
+        return models
+    
+    def compute_noi_mape_pct(self) -> Optional[float]:
+        """NOI mean absolute percentage error (%) over rows with actuals"""
+        mask = ~np.isnan(self.y_true_noi) & (self.y_true_noi != 0)
+        if not mask.any():
+            return None
+        y_true = self.y_true_noi[mask]
+        y_pred = self.y_pred_noi[mask]
+        return float(np.mean(np.abs(y_pred - y_true) / np.abs(y_true)) * 100)
+    
+    def compute_caprate_mae_bps(self) -> Optional[float]:
+        """Cap rate mean absolute error (bps) over rows with actuals"""
+        mask = ~np.isnan(self.y_true_caprate_bps)
+        if not mask.any():
+            return None
+        return float(np.mean(np.abs(self.y_pred_caprate_bps[mask] - self.y_true_caprate_bps[mask])))
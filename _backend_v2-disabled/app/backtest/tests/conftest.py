@@ -12,6 +12,12 @@ import sys
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 sys.path.insert(0, project_root)
 
+# app.backtest.config requires DATABASE_URL at import time
+os.environ.setdefault(
+    "DATABASE_URL",
+    os.getenv("TEST_DATABASE_URL", "postgresql+asyncpg://localhost:5432/capsight_test")
+)
+
 # Test markers
 pytest.mark.unit = pytest.mark.unit
 pytest.mark.integration = pytest.mark.integration  
@@ -59,8 +65,14 @@ def sample_property_data():
         'lat': np.random.uniform(40.7, 40.8, 100),
         'lng': np.random.uniform(-74.1, -73.9, 100),
         'year_built': np.random.randint(1950, 2023, 100),
-        'property_type': np.random.choice(['house', 'condo', 'townhouse'], 100),
-        'market_segment': np.random.choice(['luxury', 'mid-market', 'affordable'], 100)
+        'property_type': pd.Categorical.from_codes(
+            np.random.randint(0, 3, 100).astype(np.int8),
+            categories=['house', 'condo', 'townhouse']
+        ),
+        'market_segment': pd.Categorical.from_codes(
+            np.random.randint(0, 3, 100).astype(np.int8),
+            categories=['luxury', 'mid-market', 'affordable']
+        )
     })
 
 # Test configuration
@@ -75,6 +87,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "performance: mark test as a performance test"
     )
+    config.addinivalue_line(
+        "markers", "kernel_invariants: mark test as pinning an optimized kernel's invariants"
+    )
 
 # Test collection configuration
 def pytest_collection_modifyitems(config, items):
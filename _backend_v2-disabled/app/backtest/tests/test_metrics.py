@@ -0,0 +1,60 @@
+"""
+Tests for backtest metrics calculation.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.backtest.metrics import MetricsCalculator, _fused_binary_metrics
+
+
+# The JIT-compiled kernel and the plain-Python body used when numba is unavailable
+FUSED_KERNELS = [
+    pytest.param(_fused_binary_metrics, id="compiled"),
+    pytest.param(getattr(_fused_binary_metrics, "py_func", _fused_binary_metrics), id="python"),
+]
+
+
+class TestMetricsCalculator:
+    """Test metrics calculation."""
+    
+    def test_calculate_ml_metrics(self):
+        """Test ML metrics calculation."""
+        metrics_calc = MetricsCalculator(data_access=SimpleNamespace())
+        
+        y_true = np.array([0, 1, 1, 0, 1])
+        y_pred = np.ascontiguousarray([0.1, 0.9, 0.8, 0.2, 0.7], dtype=np.float32)
+        
+        metrics = metrics_calc.calculate_ml_metrics(y_true, y_pred)
+        
+        assert 'accuracy' in metrics
+        assert 'precision' in metrics
+        assert 'recall' in metrics
+        assert 'roc_auc' in metrics
+        assert 'f1_score' in metrics
+        
+        # Every score is above the threshold exactly when the label is positive
+        assert metrics['accuracy'] == 1.0
+        assert metrics['precision'] == 1.0
+        assert metrics['recall'] == 1.0
+        assert 0 <= metrics['roc_auc'] <= 1
+    
+    @pytest.mark.kernel_invariants
+    @pytest.mark.parametrize("kernel", FUSED_KERNELS)
+    def test_fused_binary_metrics_invariants(self, kernel):
+        """Fused confusion counts match the NumPy reference and sum to n."""
+        rng = np.random.default_rng(42)
+        y_true = rng.integers(0, 2, 1000).astype(np.float32)
+        y_score = rng.random(1000, dtype=np.float32)
+        
+        tp, fp, tn, fn = kernel(y_true, y_score, np.float32(0.5))
+        
+        actual = y_true != 0
+        predicted = y_score >= 0.5
+        assert tp == np.count_nonzero(actual & predicted)
+        assert fp == np.count_nonzero(~actual & predicted)
+        assert tn == np.count_nonzero(~actual & ~predicted)
+        assert fn == np.count_nonzero(actual & ~predicted)
+        assert tp + fp + tn + fn == len(y_true)
@@ -0,0 +1,85 @@
+"""
+Tests for backtest report rendering.
+"""
+
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from app.backtest.reports.renderer import ReportRenderer
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    """ReportRenderer with stub collaborators and templates under tmp_path."""
+    return ReportRenderer(
+        data_access=SimpleNamespace(),
+        metrics_calculator=SimpleNamespace(),
+        uplift_analyzer=SimpleNamespace(),
+        template_dir=str(tmp_path / "templates")
+    )
+
+
+class TestReportRenderer:
+    """Test report rendering functionality."""
+    
+    def test_render_html_report(self, renderer):
+        """Test HTML report rendering."""
+        # Mock report data
+        report_data = {
+            'title': 'Test Backtest Report',
+            'summary': {
+                'accuracy': 0.85,
+                'precision': 0.80,
+                'recall': 0.75
+            },
+            'charts': []
+        }
+        
+        buf = io.StringIO()
+        
+        result = renderer.render_html_report(report_data, buf)
+        
+        assert result is True
+        
+        # Check content
+        content = buf.getvalue()
+        assert 'Test Backtest Report' in content
+        assert '0.85' in content  # Accuracy should be in report
+    
+    def test_render_markdown_report(self, renderer):
+        """Test Markdown report rendering."""
+        report_data = {
+            'title': 'Test Backtest Report',
+            'summary': {'accuracy': 0.85},
+            'sections': [
+                {'title': 'Results', 'content': 'Test content'}
+            ]
+        }
+        
+        buf = io.StringIO()
+        
+        result = renderer.render_markdown_report(report_data, buf)
+        
+        assert result is True
+        
+        content = buf.getvalue()
+        assert '# Test Backtest Report' in content
+        assert 'Test content' in content
+    
+    def test_render_report_to_path(self, renderer, tmp_path):
+        """A path output creates parent directories and writes the file."""
+        output = tmp_path / "reports" / "report.md"
+        
+        assert renderer.render_markdown_report({'title': 'Path Report'}, str(output)) is True
+        assert output.read_text().startswith('# Path Report')
+    
+    def test_pdf_bytes_rejected_by_text_stream(self, renderer):
+        """Binary PDF content is refused by a text stream and accepted by a binary one."""
+        with pytest.raises(TypeError):
+            renderer._write_report(b'%PDF-1.7', io.StringIO())
+        
+        buf = io.BytesIO()
+        renderer._write_report(b'%PDF-1.7', buf)
+        assert buf.getvalue() == b'%PDF-1.7'
@@ -0,0 +1,104 @@
+"""
+Tests for the backtest result schemas.
+"""
+
+import uuid
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from app.backtest.schemas import BacktestResultDB, BacktestResultsFrame
+
+
+@pytest.fixture
+def backtest_result_rows():
+    """Result rows with float32-exact values, some missing actuals."""
+    run_id = uuid.uuid4()
+    # (y_true_noi, y_pred_noi, y_true_caprate_bps, y_pred_caprate_bps)
+    values = [
+        (100000.0, 75000.0, 500.0, 525.0),
+        (200000.0, 250000.0, 650.0, 600.0),
+        (None, 120000.0, None, 475.0),
+        (float('nan'), 80000.0, 550.0, 550.0),
+    ]
+    rows = []
+    for i, (true_noi, pred_noi, true_bps, pred_bps) in enumerate(values):
+        has_noi = true_noi is not None and not np.isnan(true_noi)
+        rows.append(BacktestResultDB(
+            id=uuid.uuid4(),
+            run_id=run_id,
+            asof_date=date(2023, 6, 1),
+            property_id=f'prop_{i}',
+            market='TX-DAL',
+            asset_type='single_family',
+            y_true_noi=true_noi,
+            y_pred_noi=pred_noi,
+            noi_mape=abs(pred_noi - true_noi) / abs(true_noi) if has_noi else None,
+            y_true_caprate_bps=true_bps,
+            y_pred_caprate_bps=pred_bps,
+            caprate_mae_bps=abs(pred_bps - true_bps) if true_bps is not None else None,
+            arbitrage_score=0.75,
+            decile_rank=i + 1,
+            confidence=0.5,
+            interval_lower=0.25,
+            interval_upper=1.5,
+            model_name='caprate_predictor',
+            model_version='1.0.0',
+            training_data_cutoff=datetime(2023, 5, 1),
+            data_sources=['mls_data', 'mortgage_rates'],
+            feature_fingerprint=f'fp_{i}',
+            created_at=datetime(2023, 6, 1, 12)
+        ))
+    return rows
+
+
+class TestBacktestResultsFrame:
+    """Test the column-oriented backtest results representation."""
+    
+    def test_round_trip(self, backtest_result_rows):
+        """from_rows -> to_models reproduces the rows, with NaN read back as None."""
+        frame = BacktestResultsFrame.from_rows(backtest_result_rows)
+        
+        assert len(frame) == len(backtest_result_rows)
+        assert frame.y_pred_noi.dtype == np.float32
+        assert frame.decile_rank.dtype == np.int8
+        
+        models = frame.to_models()
+        
+        for original, restored in zip(backtest_result_rows[:3], models[:3]):
+            assert restored == original
+        
+        # NaN inputs are packed the same way as None and come back as None
+        nan_row = models[3]
+        assert nan_row.y_true_noi is None
+        assert nan_row.noi_mape is None
+        assert nan_row.y_true_caprate_bps == 550.0
+        assert nan_row.data_sources == ['mls_data', 'mortgage_rates']
+    
+    def test_empty_round_trip(self):
+        """An empty result set packs and unpacks without error."""
+        frame = BacktestResultsFrame.from_rows([])
+        
+        assert len(frame) == 0
+        assert frame.to_models() == []
+        assert frame.compute_noi_mape_pct() is None
+        assert frame.compute_caprate_mae_bps() is None
+    
+    def test_compute_noi_mape_pct(self, backtest_result_rows):
+        """Vectorized NOI MAPE matches the mean of the per-row noi_mape values."""
+        frame = BacktestResultsFrame.from_rows(backtest_result_rows)
+        
+        per_row = [row.noi_mape for row in backtest_result_rows if row.noi_mape is not None]
+        
+        assert frame.compute_noi_mape_pct() == pytest.approx(np.mean(per_row) * 100, rel=1e-5)
+    
+    def test_compute_caprate_mae_bps(self, backtest_result_rows):
+        """Vectorized cap rate MAE matches the mean of the per-row caprate_mae_bps values."""
+        frame = BacktestResultsFrame.from_rows(backtest_result_rows)
+        
+        per_row = [
+            row.caprate_mae_bps for row in backtest_result_rows if row.caprate_mae_bps is not None
+        ]
+        
+        assert frame.compute_caprate_mae_bps() == pytest.approx(np.mean(per_row), rel=1e-5)
@@ -0,0 +1,21 @@
+"""
+Tests for as-of time slicing.
+"""
+
+import numpy as np
+
+from app.backtest.time_slicer import TimeSlicer
+
+
+class TestTimeSlicer:
+    """Test data vintage validation."""
+    
+    def test_bulk_vintage_accepts_missing_and_mixed_names(self):
+        """None and non-string names fall back to no TTL instead of raising."""
+        slicer = TimeSlicer()
+        timestamps = np.array(['2023-06-01T00:00', '2023-06-01T00:00', '2023-06-20T00:00'], dtype='datetime64[ns]')
+        asof_dates = np.array(['2023-06-15'] * 3, dtype='datetime64[D]')
+        
+        mask = slicer.validate_data_vintage_bulk(timestamps, asof_dates, [None, 7, 'unknown_source'])
+        
+        assert mask.tolist() == [True, True, False]
@@ -0,0 +1,76 @@
+"""
+Tests for uplift analysis.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.backtest.uplift import UpliftAnalyzer
+
+
+class TestUpliftAnalyzer:
+    """Test cohort construction from prediction snapshots."""
+    
+    @pytest.mark.asyncio
+    async def test_cohort_threshold_boundary(self, monkeypatch):
+        """Feature values equal to a cohort threshold stay on the same side of it."""
+        analyzer = UpliftAnalyzer(data_access=SimpleNamespace())
+        snapshots = [
+            SimpleNamespace(
+                entity_id=f'prop_{i}',
+                prediction_value=0.5,
+                created_at=datetime(2023, 1, 1),
+                prediction_proba=None,
+                feature_values={'sqft': sqft}
+            )
+            for i, sqft in enumerate([1500.2, 1500.3])
+        ]
+        
+        async def get_prediction_snapshots(run_id, cache=None):
+            return snapshots
+        
+        monkeypatch.setattr(analyzer, '_get_prediction_snapshots', get_prediction_snapshots)
+        
+        data = await analyzer._load_run_data("boundary-run", "actual_success")
+        
+        # Thresholds closer than float32 spacing (~1e-4 here) must still split the rows
+        below = analyzer._filter_cohort(data, {'feature_sqft': '<1500.20001'})
+        above = analyzer._filter_cohort(data, {'feature_sqft': '>1500.29999'})
+        assert below['entity_id'].tolist() == ['prop_0']
+        assert above['entity_id'].tolist() == ['prop_1']
+        
+        in_range = analyzer._filter_cohort(data, {'feature_sqft': (np.float64(1500.2), np.float64(1500.3))})
+        assert len(in_range) == 2
+    
+    @pytest.mark.asyncio
+    async def test_report_cache_is_scoped_to_one_report(self):
+        """Each report fetches a run's snapshots once, and the next report fetches them again."""
+        rng = np.random.default_rng(0)
+        fetches = []
+        
+        async def get_prediction_snapshots(run_id):
+            fetches.append(run_id)
+            return [
+                SimpleNamespace(
+                    entity_id=f'prop_{i}',
+                    prediction_value=int(rng.integers(0, 2)),
+                    created_at=datetime(2023, 1, 1),
+                    prediction_proba=None,
+                    feature_values={'sqft': float(rng.uniform(800, 4000))}
+                )
+                for i in range(50 + len(fetches))
+            ]
+        
+        analyzer = UpliftAnalyzer(
+            data_access=SimpleNamespace(get_prediction_snapshots=get_prediction_snapshots)
+        )
+        
+        await analyzer.generate_uplift_report("run-a", baseline_strategy="run_run-b")
+        assert sorted(fetches) == ["run-a", "run-b"]
+        
+        # A later report sees the runs' current snapshots rather than the first report's
+        await analyzer.generate_uplift_report("run-a", baseline_strategy="run_run-b")
+        assert sorted(fetches) == ["run-a", "run-a", "run-b", "run-b"]
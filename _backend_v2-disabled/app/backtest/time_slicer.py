@@ -1,41 +1,162 @@
 """
 Time slicing and as-of date logic for backtesting
 Ensures no look-ahead bias in historical predictions
+
+Kept fully annotated and free of decorated methods so it can be compiled
+with mypyc (``mypyc app/backtest/time_slicer.py``) without call-site changes.
 """
-from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from datetime import datetime, date, time, timedelta
+from calendar import monthrange
+from typing import Callable, Dict, Final, List, Optional, Sequence, Tuple, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
 import hashlib
-import json
+
+import numpy as np
+import pandas as pd
 
 from .config import config, MARKET_METADATA
 
-@dataclass
+# Historical rollout dates of each data source
+_ROLLOUT_DATES: Final[Dict[str, date]] = {
+    "mls_data": date(2015, 1, 1),
+    "mortgage_rates": date(2010, 1, 1),
+    "economic_indicators": date(2012, 1, 1),
+    "demographics": date(2010, 1, 1),
+    "market_trends": date(2018, 1, 1),
+    "comparable_sales": date(2016, 1, 1),
+    "property_tax": date(2014, 1, 1),
+    "crime_data": date(2017, 1, 1),
+    "school_ratings": date(2015, 6, 1),
+    "walkability": date(2019, 1, 1)
+}
+_DEFAULT_ROLLOUT: Final = date(2010, 1, 1)
+
+# Sources sorted by rollout date, so the first n are exactly those live by a date
+_ROLLOUT_SOURCES: Final = tuple(sorted(_ROLLOUT_DATES, key=_ROLLOUT_DATES.__getitem__))
+_ROLLOUT_SORTED_DATES: Final = np.array(
+    [_ROLLOUT_DATES[source] for source in _ROLLOUT_SOURCES], dtype='datetime64[D]'
+)
+_ROLLOUT_BITS: Final = {source: 1 << i for i, source in enumerate(_ROLLOUT_SOURCES)}
+
+# Typical publication delay of each data source
+_LATENCIES: Final[Dict[str, timedelta]] = {
+    "mls_data": timedelta(hours=4),       # 4 hour delay
+    "mortgage_rates": timedelta(hours=1),  # 1 hour delay
+    "economic_indicators": timedelta(days=3),  # 3 day delay
+    "demographics": timedelta(days=30),    # 1 month delay
+    "market_trends": timedelta(hours=6),   # 6 hour delay
+    "comparable_sales": timedelta(hours=12),  # 12 hour delay
+}
+_DEFAULT_LATENCY: Final = timedelta(hours=1)
+
+# Last representable instant of a day, i.e. datetime.max.time()
+_EOD_TIME: Final = time(23, 59, 59, 999999)
+_ONE_DAY: Final = timedelta(days=1)
+_ONE_WEEK: Final = np.timedelta64(7, 'D')
+
+# Training window sanity bounds and their messages
+_MIN_TRAIN_START: Final = date(2010, 1, 1)
+_MAX_HORIZON_AHEAD: Final = timedelta(days=365 * 3)
+_MIN_TRAIN_WINDOW_MSG: Final = "Training window ({} months) below minimum ({} months)"
+_MAX_HORIZON_MSG: Final = "Horizon ({} months) exceeds maximum ({} months)"
+_LEAKAGE_MSG: Final = "Training end date must be before prediction date"
+_TRAIN_START_MSG: Final = "Training start date is too early (before 2010)"
+_HORIZON_END_MSG: Final = "Horizon end date is too far in future (>3 years)"
+
+
+@lru_cache(maxsize=8192)
+def _asof_eod(asof_date: date) -> datetime:
+    """End-of-day cutoff for an as-of date, shared across validator calls"""
+    return datetime.combine(asof_date, _EOD_TIME)
+
+
+@lru_cache(maxsize=8192)
+def _rollout_mask(asof_date: date) -> int:
+    """Bitmask over _ROLLOUT_SOURCES of the sources live as-of a date"""
+    live = np.searchsorted(_ROLLOUT_SORTED_DATES, np.datetime64(asof_date, 'D'), side='right')
+    return (1 << int(live)) - 1
+
+
+@lru_cache(maxsize=None)
+def _market_timezone(market: str) -> str:
+    """Timezone of a market, defaulting to UTC"""
+    return MARKET_METADATA.get(market, {}).get("timezone", "UTC")
+
+
+def _add_months(d: date, n: int) -> date:
+    """Shift a date by n calendar months, clamping the day to the target month"""
+    year, month0 = divmod(d.year * 12 + d.month - 1 + n, 12)
+    month = month0 + 1
+    return date(year, month, min(d.day, monthrange(year, month)[1]))
+
+
+def _diff_months(a: date, b: date) -> int:
+    """Whole calendar months from b to a"""
+    return (a.year - b.year) * 12 + (a.month - b.month)
+
+@dataclass(frozen=True, slots=True)
 class TimeWindow:
     """Represents a training/prediction time window"""
     train_start: date
     train_end: date
     prediction_date: date
     horizon_end: date
+    _train_months: int = field(init=False, repr=False, compare=False)
+    _horizon_months: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Immutable, so the month spans can be computed once up front
+        object.__setattr__(self, "_train_months", _diff_months(self.train_end, self.train_start))
+        object.__setattr__(self, "_horizon_months", _diff_months(self.horizon_end, self.prediction_date))
     
     @property
     def train_duration_months(self) -> int:
         """Calculate training window duration in months"""
-        return (self.train_end.year - self.train_start.year) * 12 + \
-               (self.train_end.month - self.train_start.month)
+        return self._train_months
     
     @property
     def horizon_months(self) -> int:
         """Calculate horizon duration in months"""
-        return (self.horizon_end.year - self.prediction_date.year) * 12 + \
-               (self.horizon_end.month - self.prediction_date.month)
+        return self._horizon_months
 
 class TimeSlicer:
     """Handles time slicing logic for backtesting with no look-ahead bias"""
     
-    def __init__(self):
-        self.feature_ttl_constraints = config.feature_ttl_constraints
-        self.min_train_window_months = config.min_train_window_months
+    def __init__(self) -> None:
+        self.feature_ttl_constraints: Dict[str, int] = config.feature_ttl_constraints
+        self.min_train_window_months: int = config.min_train_window_months
+        
+        # Config is fixed after construction; precompute asof_window's invariants.
+        # train_start is this many months before the prediction month's first day
+        self._train_start_back_months: int = self.min_train_window_months + 1
+        self._max_horizon_months: int = config.max_horizon_months
+        
+        # Pure functions of their arguments, repeated across a sweep; memoize per instance
+        self._asof_window_cached: Callable[[date, int], TimeWindow] = \
+            lru_cache(maxsize=4096)(self._asof_window)
+        self._sources_asof_cached: Callable[[date, Tuple[str, ...]], Tuple[Tuple[str, bool], ...]] = \
+            lru_cache(maxsize=4096)(self._sources_asof)
+        self._fingerprint_cached: Callable[[date, TimeWindow, Tuple[str, ...], Optional[str]], str] = \
+            lru_cache(maxsize=4096)(self._fingerprint)
+        
+        # TTL constraints are fixed after construction; encode them once as key=seconds fields
+        self._ttl_items_frozen: Tuple[Tuple[str, int], ...] = \
+            tuple(sorted(self.feature_ttl_constraints.items()))
+        self._ttl_bytes: bytes = b"\x1f".join(
+            f"{key}={seconds}".encode() for key, seconds in self._ttl_items_frozen
+        )
+        self._ttl_deltas: Dict[str, timedelta] = {
+            key: timedelta(seconds=seconds)
+            for key, seconds in self.feature_ttl_constraints.items()
+        }
+        
+        # Parallel lookup tables for the bulk validator; the last slot means "no TTL"
+        self._ttl_ids: Dict[str, int] = {key: i for i, key in enumerate(self.feature_ttl_constraints)}
+        self._no_ttl_id: int = len(self._ttl_ids)
+        self._ttl_ns: np.ndarray = np.array(
+            list(self.feature_ttl_constraints.values()) + [0], dtype=np.int64
+        ).astype('timedelta64[s]').astype('timedelta64[ns]')
     
     def asof_window(self, asof_date: date, horizon_months: int = 6) -> TimeWindow:
         """
@@ -48,43 +169,25 @@ class TimeSlicer:
         Returns:
             TimeWindow with train/prediction boundaries
         """
+        return self._asof_window_cached(asof_date, horizon_months)
+    
+    def _asof_window(self, asof_date: date, horizon_months: int) -> TimeWindow:
+        """Uncached asof_window implementation"""
         # Prediction date is the as-of date
         prediction_date = asof_date
         
         # Training end is slightly before prediction to avoid leakage
         # Use end of previous month to ensure clean separation
-        if prediction_date.day == 1:
-            train_end = (prediction_date - timedelta(days=1))
-        else:
-            train_end = date(prediction_date.year, prediction_date.month, 1) - timedelta(days=1)
+        train_end = prediction_date.replace(day=1) - _ONE_DAY
         
         # Training start based on minimum window requirement
-        train_start = date(
-            train_end.year - (self.min_train_window_months // 12),
-            train_end.month - (self.min_train_window_months % 12),
-            1
+        start_year, start_month0 = divmod(
+            prediction_date.year * 12 + prediction_date.month - 1 - self._train_start_back_months, 12
         )
-        
-        # Handle month rollover
-        if train_start.month <= 0:
-            train_start = train_start.replace(
-                year=train_start.year - 1,
-                month=train_start.month + 12
-            )
+        train_start = date(start_year, start_month0 + 1, 1)
         
         # Horizon end date
-        horizon_end = date(
-            prediction_date.year + (horizon_months // 12),
-            prediction_date.month + (horizon_months % 12),
-            prediction_date.day
-        )
-        
-        # Handle month rollover for horizon
-        if horizon_end.month > 12:
-            horizon_end = horizon_end.replace(
-                year=horizon_end.year + (horizon_end.month - 1) // 12,
-                month=((horizon_end.month - 1) % 12) + 1
-            )
+        horizon_end = _add_months(prediction_date, horizon_months)
         
         return TimeWindow(
             train_start=train_start,
@@ -93,6 +196,38 @@ class TimeSlicer:
             horizon_end=horizon_end
         )
     
+    def asof_window_arrays(self, asof_dates: Any, horizon_months: int = 6) -> pd.DataFrame:
+        """
+        Vectorized asof_window over many as-of dates
+        
+        Window boundaries are computed as datetime64[D] columns using integer
+        month arithmetic on datetime64[M]; dates only materialize at the caller.
+        
+        Returns:
+            DataFrame with one row per as-of date and TimeWindow's field names as columns
+        """
+        prediction_date = np.asarray(asof_dates, dtype='datetime64[D]')
+        prediction_month = prediction_date.astype('datetime64[M]')
+        
+        # Last day of the previous month, and the first of the month
+        # min_train_window_months before that
+        train_end = prediction_month.astype('datetime64[D]') - 1
+        train_start = (prediction_month - self._train_start_back_months).astype('datetime64[D]')
+        
+        # Same day horizon_months later, clamped to the target month's length
+        horizon_month = prediction_month + horizon_months
+        horizon_month_start = horizon_month.astype('datetime64[D]')
+        days_in_month = (horizon_month + 1).astype('datetime64[D]') - horizon_month_start
+        day_offset = prediction_date - prediction_month.astype('datetime64[D]')
+        horizon_end = horizon_month_start + np.minimum(day_offset, days_in_month - 1)
+        
+        return pd.DataFrame({
+            "train_start": train_start,
+            "train_end": train_end,
+            "prediction_date": prediction_date,
+            "horizon_end": horizon_end
+        })
+    
     def generate_asof_dates(
         self,
         start_date: date,
@@ -110,38 +245,32 @@ class TimeSlicer:
         Returns:
             List of as-of dates
         """
-        dates = []
-        current_date = start_date
+        start = np.datetime64(start_date, 'D')
+        end = np.datetime64(end_date, 'D')
         
+        # Pick the stride once, then build the whole schedule in one arange
         if frequency == "weekly":
-            delta = timedelta(weeks=1)
+            schedule = np.arange(start, end + 1, _ONE_WEEK, dtype='datetime64[D]')
+            return schedule.tolist()
         elif frequency == "monthly":
-            delta = timedelta(days=30)  # Approximate, will adjust
+            # First of every month after the start month
+            first = start.astype('datetime64[M]') + 1
+            step = 1
         elif frequency == "quarterly":
-            delta = timedelta(days=90)  # Approximate, will adjust
+            # First of every quarter after the start quarter (the epoch is a quarter start)
+            start_month = start.astype('datetime64[M]')
+            first = start_month + (3 - start_month.astype(np.int64) % 3)
+            step = 3
         else:
             raise ValueError(f"Unsupported frequency: {frequency}")
         
-        while current_date <= end_date:
-            dates.append(current_date)
-            
-            if frequency == "monthly":
-                # Move to first of next month
-                if current_date.month == 12:
-                    current_date = date(current_date.year + 1, 1, 1)
-                else:
-                    current_date = date(current_date.year, current_date.month + 1, 1)
-            elif frequency == "quarterly":
-                # Move to first of next quarter
-                next_quarter_month = ((current_date.month - 1) // 3 + 1) * 3 + 1
-                if next_quarter_month > 12:
-                    current_date = date(current_date.year + 1, 1, 1)
-                else:
-                    current_date = date(current_date.year, next_quarter_month, 1)
-            else:
-                current_date += delta
-        
-        return dates
+        if start_date > end_date:
+            return []
+        
+        period_starts = np.arange(
+            first, end.astype('datetime64[M]') + 1, step, dtype='datetime64[M]'
+        ).astype('datetime64[D]')
+        return [start_date] + period_starts.tolist()
     
     def validate_data_vintage(
         self,
@@ -163,23 +292,84 @@ class TimeSlicer:
             True if data should be available as-of prediction date
         """
         # Convert as-of date to end-of-day datetime
-        asof_datetime = datetime.combine(asof_date, datetime.max.time())
+        asof_datetime = _asof_eod(asof_date)
         
         # Check basic temporal constraint
         if data_timestamp > asof_datetime:
             return False
         
-        # Check feature TTL constraints
-        ttl_key = feature_name if feature_name in self.feature_ttl_constraints else data_source
-        ttl_seconds = self.feature_ttl_constraints.get(ttl_key)
+        # Check feature TTL constraints, falling back to the source's TTL
+        ttl = self._ttl_deltas.get(feature_name)
+        if ttl is None:
+            ttl = self._ttl_deltas.get(data_source)
+        
+        # Data must not be fresher than allowed TTL at as-of date
+        return not (ttl and data_timestamp > asof_datetime - ttl)
+    
+    def validate_data_vintage_bulk(
+        self,
+        timestamps: np.ndarray,
+        asof_dates: Any,
+        sources: Any,
+        feature_names: Optional[Any] = None
+    ) -> np.ndarray:
+        """
+        Vectorized validate_data_vintage over arrays of observations
         
-        if ttl_seconds:
-            # Data must not be fresher than allowed TTL at as-of date
-            earliest_allowed = asof_datetime - timedelta(seconds=ttl_seconds)
-            if data_timestamp > earliest_allowed:
-                return False
+        Args:
+            timestamps: datetime64 array of when each row became available
+            asof_dates: as-of date per row (array or a single date)
+            sources: data source per row (array or a single name)
+            feature_names: optional feature name per row for fine-grained TTL
+            
+        Returns:
+            Boolean mask, True where the row is usable as-of its date
+        """
+        timestamps = np.asarray(timestamps, dtype='datetime64[ns]')
+        
+        # End of the as-of day at microsecond precision, matching _asof_eod
+        asof_eod = (
+            np.asarray(asof_dates, dtype='datetime64[D]').astype('datetime64[ns]')
+            + np.timedelta64(1, 'D') - np.timedelta64(1, 'us')
+        )
+        
+        # Feature TTLs take precedence over source TTLs, as in the scalar path
+        ttl_ids = self._lookup_ttl_ids(sources)
+        if feature_names is not None:
+            feature_ids = self._lookup_ttl_ids(feature_names)
+            ttl_ids = np.where(feature_ids != self._no_ttl_id, feature_ids, ttl_ids)
+        ttl = self._ttl_ns[ttl_ids]
+        
+        available = timestamps <= asof_eod
+        fresh_enough = (ttl == np.timedelta64(0, 'ns')) | (timestamps <= asof_eod - ttl)
+        return available & fresh_enough
+    
+    def _lookup_ttl_ids(self, names: Any) -> np.ndarray:
+        """Map names to TTL table slots, resolving each distinct name once"""
+        # factorize hashes rather than sorts, so None and mixed-type names are fine
+        inverse, uniques = pd.factorize(
+            np.ravel(np.asarray(names, dtype=object)), use_na_sentinel=False
+        )
+        ids = np.array(
+            [self._ttl_ids.get(name, self._no_ttl_id) for name in uniques],
+            dtype=np.int32
+        )
+        return ids[inverse].reshape(np.shape(names))
+    
+    def filter_as_of(
+        self,
+        df: pd.DataFrame,
+        asof: datetime,
+        timestamp_column: str = "timestamp"
+    ) -> pd.DataFrame:
+        """
+        Keep only rows observed at or before the as-of cutoff
         
-        return True
+        The cutoff is converted to datetime64 once and compared against the
+        column's underlying ndarray, bypassing Series-level dispatch.
+        """
+        cutoff = pd.Timestamp(asof).to_datetime64()
+        return df[df[timestamp_column].to_numpy() <= cutoff]
     
     def compute_feature_fingerprint(
         self,
@@ -192,23 +382,39 @@ class TimeSlicer:
         Compute stable fingerprint for feature set and time window
         Used for caching and auditing
         """
-        fingerprint_data = {
-            "asof_date": asof_date.isoformat(),
-            "train_start": training_window.train_start.isoformat(),
-            "train_end": training_window.train_end.isoformat(),
-            "prediction_date": training_window.prediction_date.isoformat(),
-            "horizon_end": training_window.horizon_end.isoformat(),
-            "feature_sources": sorted(feature_sources),
-            "model_version": model_version,
-            "ttl_constraints": sorted(self.feature_ttl_constraints.items())
-        }
-        
-        fingerprint_json = json.dumps(fingerprint_data, sort_keys=True)
-        return hashlib.sha256(fingerprint_json.encode()).hexdigest()[:16]
+        return self._fingerprint_cached(
+            asof_date,
+            training_window,
+            tuple(sorted(feature_sources)),
+            model_version
+        )
+    
+    def _fingerprint(
+        self,
+        asof_date: date,
+        training_window: TimeWindow,
+        feature_sources: Tuple[str, ...],
+        model_version: Optional[str]
+    ) -> str:
+        """Uncached compute_feature_fingerprint implementation"""
+        # NUL-separated ASCII fields; sources are joined with the unit separator
+        fingerprint_bytes = b"\x00".join((
+            asof_date.isoformat().encode(),
+            training_window.train_start.isoformat().encode(),
+            training_window.train_end.isoformat().encode(),
+            training_window.prediction_date.isoformat().encode(),
+            training_window.horizon_end.isoformat().encode(),
+            "\x1f".join(feature_sources).encode(),
+            # 0xFF never occurs in UTF-8, so a missing version can't collide with ""
+            model_version.encode() if model_version is not None else b"\xff",
+            self._ttl_bytes
+        ))
+        # 64-bit BLAKE2b digest is exactly the 16 hex chars we expose
+        return hashlib.blake2b(fingerprint_bytes, digest_size=8).hexdigest()
     
     def get_market_timezone(self, market: str) -> str:
         """Get timezone for market (for proper as-of cutoffs)"""
-        return MARKET_METADATA.get(market, {}).get("timezone", "UTC")
+        return _market_timezone(market)
     
     def adjust_for_market_hours(
         self,
@@ -225,12 +431,14 @@ class TimeSlicer:
         if data_source in ["mls_data", "market_prices"]:
             # If as-of time is before 9 AM, use previous business day
             if asof_datetime.hour < 9:
-                asof_datetime = asof_datetime.replace(hour=17, minute=0, second=0) - timedelta(days=1)
+                asof_datetime -= _ONE_DAY
                 
-                # Skip weekends
-                while asof_datetime.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                    asof_datetime -= timedelta(days=1)
-                    asof_datetime = asof_datetime.replace(hour=17, minute=0, second=0)
+                # Skip weekends: step back from Saturday (5) / Sunday (6) to Friday
+                weekday = asof_datetime.weekday()
+                if weekday >= 5:
+                    asof_datetime -= timedelta(days=weekday - 4)
+                
+                asof_datetime = asof_datetime.replace(hour=17, minute=0, second=0)
         
         return asof_datetime
     
@@ -245,35 +453,33 @@ class TimeSlicer:
         
         # Check minimum training window
         if window.train_duration_months < self.min_train_window_months:
-            issues.append(
-                f"Training window ({window.train_duration_months} months) below minimum "
-                f"({self.min_train_window_months} months)"
-            )
+            issues.append(_MIN_TRAIN_WINDOW_MSG.format(
+                window.train_duration_months, self.min_train_window_months
+            ))
         
         # Check for temporal leakage
         if window.train_end >= window.prediction_date:
-            issues.append("Training end date must be before prediction date")
+            issues.append(_LEAKAGE_MSG)
         
         # Check horizon reasonableness
-        if window.horizon_months > config.max_horizon_months:
-            issues.append(
-                f"Horizon ({window.horizon_months} months) exceeds maximum "
-                f"({config.max_horizon_months} months)"
-            )
+        if window.horizon_months > self._max_horizon_months:
+            issues.append(_MAX_HORIZON_MSG.format(
+                window.horizon_months, self._max_horizon_months
+            ))
         
         # Check for realistic time ranges
-        if window.train_start < date(2010, 1, 1):
-            issues.append("Training start date is too early (before 2010)")
+        if window.train_start < _MIN_TRAIN_START:
+            issues.append(_TRAIN_START_MSG)
         
-        if window.horizon_end > date.today() + timedelta(days=365*3):
-            issues.append("Horizon end date is too far in future (>3 years)")
+        if window.horizon_end > date.today() + _MAX_HORIZON_AHEAD:
+            issues.append(_HORIZON_END_MSG)
         
         return issues
     
     def get_data_sources_asof(
         self,
         asof_date: date,
-        required_sources: List[str]
+        required_sources: Sequence[str]
     ) -> Dict[str, bool]:
         """
         Check which data sources should be available as-of date
@@ -281,27 +487,20 @@ class TimeSlicer:
         Returns:
             Dict mapping source name to availability boolean
         """
-        availability = {}
-        
-        for source in required_sources:
-            # Simulate data source availability based on historical rollout dates
-            rollout_dates = {
-                "mls_data": date(2015, 1, 1),
-                "mortgage_rates": date(2010, 1, 1),
-                "economic_indicators": date(2012, 1, 1),
-                "demographics": date(2010, 1, 1),
-                "market_trends": date(2018, 1, 1),
-                "comparable_sales": date(2016, 1, 1),
-                "property_tax": date(2014, 1, 1),
-                "crime_data": date(2017, 1, 1),
-                "school_ratings": date(2015, 6, 1),
-                "walkability": date(2019, 1, 1)
-            }
-            
-            rollout_date = rollout_dates.get(source, date(2010, 1, 1))
-            availability[source] = asof_date >= rollout_date
-        
-        return availability
+        return dict(self._sources_asof_cached(asof_date, tuple(required_sources)))
+    
+    def _sources_asof(
+        self,
+        asof_date: date,
+        required_sources: Tuple[str, ...]
+    ) -> Tuple[Tuple[str, bool], ...]:
+        """Uncached get_data_sources_asof implementation, as hashable pairs"""
+        mask = _rollout_mask(asof_date)
+        default_available = asof_date >= _DEFAULT_ROLLOUT
+        return tuple(
+            (source, bool(mask & _ROLLOUT_BITS[source]) if source in _ROLLOUT_BITS else default_available)
+            for source in required_sources
+        )
     
     def simulate_data_latency(
         self,
@@ -314,17 +513,7 @@ class TimeSlicer:
         Returns:
             Actual available timestamp considering latency
         """
-        latencies = {
-            "mls_data": timedelta(hours=4),       # 4 hour delay
-            "mortgage_rates": timedelta(hours=1),  # 1 hour delay
-            "economic_indicators": timedelta(days=3),  # 3 day delay
-            "demographics": timedelta(days=30),    # 1 month delay
-            "market_trends": timedelta(hours=6),   # 6 hour delay
-            "comparable_sales": timedelta(hours=12),  # 12 hour delay
-        }
-        
-        latency = latencies.get(data_source, timedelta(hours=1))
-        return asof_datetime - latency
+        return asof_datetime - _LATENCIES.get(data_source, _DEFAULT_LATENCY)
 
 # Global instance
 time_slicer = TimeSlicer()
@@ -3,18 +3,167 @@ Uplift analysis and causal inference for backtesting
 Measures incremental impact of predictions vs baseline strategies
 """
 import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
 from typing import Dict, List, Optional, Any, Tuple
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from scipy import stats
 from sklearn.model_selection import StratifiedKFold
 
+# Numba JIT for the bootstrap reduction kernel
+try:
+    from numba import njit
+except ImportError:
+    # Fall back to plain Python when numba is unavailable
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# NumExpr fuses the ROI compare-and-count expressions into a single pass
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
 from .config import config
-from .schemas import BacktestRun, PredictionSnapshot
+from .schemas import PredictionSnapshot
 from .data_access import BacktestDataAccess
 
+# Upper bound on gathered elements per bootstrap block (~16M, i.e. 64 MB of int32 indices)
+_BOOTSTRAP_BLOCK_ELEMENTS = 1 << 24
+
+# Prediction features carried through for cohort stratification
+_KEY_FEATURES = ("sqft", "bedrooms", "median_price_zip", "mortgage_rate_30y")
+
+# Fixed seed so bootstrap intervals are reproducible across calls
+_BOOTSTRAP_SEED = 42
+
+# Resamples per significance test
+_N_BOOTSTRAP = 1000
+
+# Below this many rows the bootstrap runs inline instead of in the process pool
+_BOOTSTRAP_POOL_MIN_SAMPLES = 10_000
+
+# Bootstrap worker pool shared by every analyzer; created on the first large bootstrap
+_bootstrap_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_bootstrap_pool() -> ProcessPoolExecutor:
+    """Return the shared bootstrap pool, starting it on first use"""
+    global _bootstrap_pool
+    if _bootstrap_pool is None:
+        _bootstrap_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _bootstrap_pool
+
+
+def shutdown_bootstrap_pool(wait: bool = True) -> None:
+    """Shut down the shared bootstrap pool; a later large bootstrap starts a new one"""
+    global _bootstrap_pool
+    pool, _bootstrap_pool = _bootstrap_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+# Reassociation lets LLVM vectorize the sums; NaN checks must survive, so no full fastmath
+@njit(cache=True, fastmath={"reassoc", "contract"})
+def _bootstrap_mean_diffs(treatment_scores, baseline_scores, boot_indices):
+    """Treatment minus baseline mean score per resample row, skipping NaN scores"""
+    n_boot, n_samples = boot_indices.shape
+    diffs = np.empty(n_boot, dtype=np.float64)
+    for b in range(n_boot):
+        treatment_sum = 0.0
+        baseline_sum = 0.0
+        treatment_count = 0
+        baseline_count = 0
+        for j in range(n_samples):
+            i = boot_indices[b, j]
+            t = treatment_scores[i]
+            if not np.isnan(t):
+                treatment_sum += t
+                treatment_count += 1
+            s = baseline_scores[i]
+            if not np.isnan(s):
+                baseline_sum += s
+                baseline_count += 1
+        treatment_mean = treatment_sum / treatment_count if treatment_count else np.nan
+        baseline_mean = baseline_sum / baseline_count if baseline_count else np.nan
+        diffs[b] = treatment_mean - baseline_mean
+    return diffs
+
+def _bootstrap_diff(
+    treatment_scores: np.ndarray,
+    baseline_scores: np.ndarray,
+    n_bootstrap: int,
+    seed: int,
+    alpha: float
+) -> Tuple[float, Tuple[float, float]]:
+    """Bootstrap p-value and confidence interval of the treatment-baseline mean score gap
+    
+    Module-level so it can be pickled to a worker process.
+    """
+    # Use bootstrap to calculate confidence interval; resamples are drawn as index
+    # matrices (in blocks to bound peak memory) and reduced by a fused JIT kernel
+    # that skips missing predictions (e.g. from a run_ baseline), as pandas' mean does
+    n_samples = len(treatment_scores)
+    rng = np.random.default_rng(seed)
+    
+    if _is_binary(treatment_scores, baseline_scores):
+        # Each row is one of four (treatment, baseline) outcome pairs, so a resample
+        # of n rows is exactly a multinomial draw of n over those pair frequencies
+        pair_counts = np.bincount(
+            2 * treatment_scores.astype(np.intp) + baseline_scores, minlength=4
+        )
+        resampled = rng.multinomial(n_samples, pair_counts / n_samples, size=n_bootstrap)
+        # Mean gap is (treatment-only hits - baseline-only hits) / n
+        bootstrap_diffs = (resampled[:, 2] - resampled[:, 1]) / n_samples
+    else:
+        bootstrap_diffs = np.empty(n_bootstrap, dtype=np.float64)
+        block = max(1, _BOOTSTRAP_BLOCK_ELEMENTS // max(n_samples, 1))
+        for start in range(0, n_bootstrap, block):
+            stop = min(start + block, n_bootstrap)
+            boot_indices = rng.integers(
+                0, n_samples, size=(stop - start, n_samples), dtype=np.int32
+            )
+            bootstrap_diffs[start:stop] = _bootstrap_mean_diffs(
+                treatment_scores, baseline_scores, boot_indices
+            )
+    
+    # Calculate p-value (two-tailed test) from integer tail counts
+    at_or_below = np.count_nonzero(bootstrap_diffs <= 0)
+    at_or_above = np.count_nonzero(bootstrap_diffs >= 0)
+    p_value = 2.0 * min(at_or_below, at_or_above) / n_bootstrap
+    
+    # Calculate confidence interval; both bounds come from one partition
+    ci_lower, ci_upper = np.quantile(bootstrap_diffs, [alpha / 2, 1 - alpha / 2])
+    
+    return p_value, (ci_lower, ci_upper)
+
+def _is_binary(treatment_scores: np.ndarray, baseline_scores: np.ndarray) -> bool:
+    """Whether both score arrays are 0/1 correctness indicators (integer dtype)"""
+    return treatment_scores.dtype.kind in "iub" and baseline_scores.dtype.kind in "iub"
+
+def _mean_score(scores: np.ndarray) -> float:
+    """Mean of the non-NaN scores (NaN if there are none), matching pandas' skipna mean"""
+    if scores.dtype.kind in "iub":
+        return float(scores.mean(dtype=np.float64)) if len(scores) else np.nan
+    valid = ~np.isnan(scores)
+    count = np.count_nonzero(valid)
+    if not count:
+        return np.nan
+    return float(scores.sum(where=valid, dtype=np.float64) / count)
+
+def _count_both(predictions: np.ndarray, outcomes: np.ndarray, outcome_value: int) -> int:
+    """Count rows predicted positive whose outcome equals outcome_value"""
+    if ne is not None:
+        return int(ne.evaluate(
+            "sum(where((p == 1) & (o == v), 1, 0))",
+            local_dict={"p": predictions, "o": outcomes, "v": outcome_value}
+        ))
+    return int(np.count_nonzero((predictions == 1) & (outcomes == outcome_value)))
+
 @dataclass
 class UpliftResults:
     """Results of uplift analysis"""
@@ -35,6 +184,18 @@ class CohortUplift:
     sample_size: int
     uplift_results: UpliftResults
 
+@dataclass
+class _RunDataCache:
+    """Run loads shared by the sub-analyses of one generate_uplift_report call
+    
+    Lives only as long as that call, so a later report always sees fresh
+    snapshots (e.g. of a run that was still in progress) and nothing accumulates
+    on the shared analyzer.
+    """
+    frames: Dict[Tuple[str, str], pd.DataFrame] = field(default_factory=dict)
+    snapshots: Dict[str, List[PredictionSnapshot]] = field(default_factory=dict)
+    snapshot_locks: Dict[str, asyncio.Lock] = field(default_factory=dict)
+
 class UpliftAnalyzer:
     """Analyzes uplift and causal impact of predictions"""
     
@@ -42,11 +203,22 @@ class UpliftAnalyzer:
         self.data_access = data_access or BacktestDataAccess()
         self.significance_level = config.statistical_significance_level
     
+    async def __aenter__(self) -> "UpliftAnalyzer":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Release the bootstrap worker processes"""
+        shutdown_bootstrap_pool()
+    
     async def calculate_uplift_vs_baseline(
         self,
         treatment_run_id: str,
         baseline_strategy: str = "random",
-        outcome_column: str = "actual_success"
+        outcome_column: str = "actual_success",
+        cache: Optional[_RunDataCache] = None
     ) -> UpliftResults:
         """
         Calculate uplift of treatment predictions vs baseline strategy
@@ -55,29 +227,33 @@ class UpliftAnalyzer:
             treatment_run_id: ID of backtest run to evaluate
             baseline_strategy: "random", "always_invest", "never_invest", or another run_id
             outcome_column: Column name for outcome measurement
+            cache: Run loads shared with sibling analyses of the same report (optional)
             
         Returns:
             UpliftResults with statistical analysis
         """
         # Load treatment predictions and outcomes
-        treatment_data = await self._load_run_data(treatment_run_id, outcome_column)
+        treatment_data = await self._load_run_data(treatment_run_id, outcome_column, cache)
         
         # Generate or load baseline predictions
         baseline_data = await self._generate_baseline_data(
-            treatment_data, baseline_strategy, outcome_column
+            treatment_data, baseline_strategy, outcome_column, cache
         )
         
         # Calculate uplift
-        treatment_performance = self._calculate_performance(
+        # Score each row once; performance and the bootstrap both reduce these
+        treatment_scores = self._prediction_scores(
             treatment_data, "treatment_prediction", outcome_column
         )
-        baseline_performance = self._calculate_performance(
+        baseline_scores = self._prediction_scores(
             baseline_data, "baseline_prediction", outcome_column
         )
+        treatment_performance = _mean_score(treatment_scores)
+        baseline_performance = _mean_score(baseline_scores)
         
         # Statistical significance testing
-        p_value, confidence_interval = self._calculate_significance(
-            treatment_data, baseline_data, outcome_column
+        p_value, confidence_interval = await self._calculate_significance(
+            treatment_scores, baseline_scores
         )
         
         # Calculate uplift metrics
@@ -95,83 +271,134 @@ class UpliftAnalyzer:
             absolute_uplift=absolute_uplift
         )
     
-    async def _load_run_data(self, run_id: str, outcome_column: str) -> pd.DataFrame:
+    async def _get_prediction_snapshots(
+        self,
+        run_id: str,
+        cache: Optional[_RunDataCache] = None
+    ) -> List[PredictionSnapshot]:
+        """Fetch a run's prediction snapshots, once per cache even under concurrent callers"""
+        
+        if cache is None:
+            return await self.data_access.get_prediction_snapshots(run_id)
+        
+        lock = cache.snapshot_locks.setdefault(run_id, asyncio.Lock())
+        async with lock:
+            if run_id not in cache.snapshots:
+                cache.snapshots[run_id] = await self.data_access.get_prediction_snapshots(run_id)
+            return cache.snapshots[run_id]
+    
+    async def _load_run_data(
+        self,
+        run_id: str,
+        outcome_column: str,
+        cache: Optional[_RunDataCache] = None
+    ) -> pd.DataFrame:
         """Load predictions and outcomes for a run"""
         
+        key = (run_id, outcome_column)
+        if cache is not None and key in cache.frames:
+            # Shallow copy so callers adding columns don't touch the cached frame
+            return cache.frames[key].copy(deep=False)
+        
         # Load predictions
-        predictions = await self.data_access.get_prediction_snapshots(run_id)
+        predictions = await self._get_prediction_snapshots(run_id, cache)
         if not predictions:
             raise ValueError(f"No predictions found for run {run_id}")
         
-        # Convert to DataFrame
-        pred_records = []
-        for pred in predictions:
-            record = {
-                "entity_id": pred.entity_id,
-                "treatment_prediction": pred.prediction_value,
-                "prediction_timestamp": pred.created_at
-            }
+        # Convert to DataFrame from per-column arrays filled in a single pass
+        n = len(predictions)
+        entity_ids = np.empty(n, dtype=object)
+        treatment_preds = np.empty(n, dtype=np.float64)
+        timestamps = np.empty(n, dtype=object)
+        proba_columns: Dict[str, np.ndarray] = {}
+        # Float64 like the thresholds in cohort filters, so boundary values compare exactly
+        feature_columns = {
+            feature: np.full(n, np.nan, dtype=np.float64) for feature in _KEY_FEATURES
+        }
+        seen_features = set()
+        
+        for i, pred in enumerate(predictions):
+            entity_ids[i] = pred.entity_id
+            treatment_preds[i] = pred.prediction_value
+            timestamps[i] = pred.created_at
             
             # Add probabilities if available
             if pred.prediction_proba:
-                record.update(pred.prediction_proba)
+                for key, value in pred.prediction_proba.items():
+                    if key not in proba_columns:
+                        proba_columns[key] = np.full(n, np.nan)
+                    proba_columns[key][i] = value
             
             # Add key features for stratification
             if pred.feature_values:
-                key_features = ["sqft", "bedrooms", "median_price_zip", "mortgage_rate_30y"]
-                for feature in key_features:
+                for feature, values in feature_columns.items():
                     if feature in pred.feature_values:
-                        record[f"feature_{feature}"] = pred.feature_values[feature]
-            
-            pred_records.append(record)
-        
-        pred_df = pd.DataFrame(pred_records)
-        
-        # Load actual outcomes (mock implementation)
-        outcomes_df = await self._load_actual_outcomes(run_id, outcome_column)
+                        values[i] = pred.feature_values[feature]
+                        seen_features.add(feature)
+        
+        columns = {
+            # Categorical ids keep per-row storage to small integer codes
+            "entity_id": pd.Categorical(entity_ids),
+            "treatment_prediction": treatment_preds,
+            "prediction_timestamp": pd.to_datetime(timestamps)
+        }
+        columns.update(proba_columns)
+        columns.update(
+            (f"feature_{feature}", values)
+            for feature, values in feature_columns.items()
+            if feature in seen_features
+        )
+        pred_df = pd.DataFrame(columns)
         
-        # Merge predictions with outcomes
-        merged_df = pred_df.merge(outcomes_df, on="entity_id", how="inner")
+        # Load actual outcomes (mock implementation), aligned row-for-row with the predictions
+        pred_df[outcome_column] = await self._load_actual_outcomes(entity_ids, outcome_column)
         
-        return merged_df
+        if cache is None:
+            return pred_df
+        cache.frames[key] = pred_df
+        return pred_df.copy(deep=False)
     
-    async def _load_actual_outcomes(self, run_id: str, outcome_column: str) -> pd.DataFrame:
-        """Load actual outcomes for entities in the run"""
+    async def _load_actual_outcomes(self, entity_ids: np.ndarray, outcome_column: str) -> np.ndarray:
+        """Load actual outcomes for the given entities, in the same order"""
         
         # Mock outcomes - in production this would query actual data
-        predictions = await self.data_access.get_prediction_snapshots(run_id)
-        entity_ids = [p.entity_id for p in predictions]
         n_entities = len(entity_ids)
         
-        np.random.seed(42)  # For reproducible results
+        rng = np.random.default_rng(42)  # For reproducible results
         
         if outcome_column == "actual_success":
             # Binary outcome: investment success
-            outcomes = np.random.binomial(1, 0.6, n_entities)
+            outcomes = rng.binomial(1, 0.6, n_entities)
         elif outcome_column == "actual_appreciation":
             # Continuous outcome: price appreciation
-            outcomes = np.random.normal(0.05, 0.1, n_entities)
+            outcomes = rng.normal(0.05, 0.1, n_entities)
         elif outcome_column == "actual_rental_yield":
             # Continuous outcome: rental yield
-            outcomes = np.random.normal(0.06, 0.02, n_entities)
+            outcomes = rng.normal(0.06, 0.02, n_entities)
         else:
             # Default to success rate
-            outcomes = np.random.binomial(1, 0.6, n_entities)
+            outcomes = rng.binomial(1, 0.6, n_entities)
         
-        return pd.DataFrame({
-            "entity_id": entity_ids,
-            outcome_column: outcomes
-        })
+        return outcomes
     
     async def _generate_baseline_data(
         self,
         treatment_data: pd.DataFrame,
         baseline_strategy: str,
-        outcome_column: str
+        outcome_column: str,
+        cache: Optional[_RunDataCache] = None
     ) -> pd.DataFrame:
         """Generate baseline predictions for comparison"""
         
-        baseline_data = treatment_data.copy()
+        # Downstream consumers only read the id, outcome and baseline columns; share
+        # the treatment frame's arrays rather than copying them
+        baseline_data = pd.DataFrame(
+            {
+                "entity_id": treatment_data["entity_id"],
+                outcome_column: treatment_data[outcome_column],
+            },
+            copy=False
+        )
         
         if baseline_strategy == "random":
             # Random predictions
@@ -204,94 +431,84 @@ class UpliftAnalyzer:
         elif baseline_strategy.startswith("run_"):
             # Use another run as baseline
             baseline_run_id = baseline_strategy[4:]  # Remove "run_" prefix
-            baseline_preds = await self.data_access.get_prediction_snapshots(baseline_run_id)
+            baseline_preds = await self._get_prediction_snapshots(baseline_run_id, cache)
             
-            baseline_dict = {pred.entity_id: pred.prediction_value for pred in baseline_preds}
-            baseline_data["baseline_prediction"] = baseline_data["entity_id"].map(baseline_dict)
+            # Hash-indexed lookup; the last prediction wins for repeated entities, as with a dict
+            lookup = pd.Series(
+                np.fromiter(
+                    (pred.prediction_value for pred in baseline_preds),
+                    dtype=np.float64, count=len(baseline_preds)
+                ),
+                index=pd.Index([pred.entity_id for pred in baseline_preds], dtype=object)
+            )
+            if not lookup.index.is_unique:
+                lookup = lookup[~lookup.index.duplicated(keep="last")]
+            baseline_data["baseline_prediction"] = lookup.reindex(
+                baseline_data["entity_id"].to_numpy()
+            ).to_numpy()
             
         else:
             raise ValueError(f"Unknown baseline strategy: {baseline_strategy}")
         
         return baseline_data
     
-    def _calculate_performance(
+    def _prediction_scores(
         self,
         data: pd.DataFrame,
         prediction_column: str,
         outcome_column: str
-    ) -> float:
-        """Calculate performance metric for predictions"""
+    ) -> np.ndarray:
+        """Per-row scores whose mean is the performance metric (NaN where unscored)"""
         
         y_pred = data[prediction_column]
         y_true = data[outcome_column]
         
         if outcome_column in ["actual_success"]:
-            # Binary classification: use accuracy
-            return (y_pred == y_true).mean()
+            # Binary classification: correctness indicator, as int8 to keep the bootstrap
+            # gather narrow (a missing prediction never equals the outcome, so no NaN needed)
+            return (y_pred == y_true).to_numpy(dtype=np.int8)
         else:
-            # Regression: use negative MAE (higher is better)
-            return -np.mean(np.abs(y_pred - y_true))
+            # Regression: negative absolute error (higher is better)
+            return -np.abs(y_pred - y_true).to_numpy(dtype=np.float64)
     
-    def _calculate_significance(
+    def _calculate_performance(
         self,
-        treatment_data: pd.DataFrame,
-        baseline_data: pd.DataFrame,
+        data: pd.DataFrame,
+        prediction_column: str,
         outcome_column: str
-    ) -> Tuple[float, Tuple[float, float]]:
-        """Calculate statistical significance and confidence interval"""
-        
-        # Performance for treatment and baseline
-        treatment_perf = self._calculate_performance(
-            treatment_data, "treatment_prediction", outcome_column
-        )
-        baseline_perf = self._calculate_performance(
-            baseline_data, "baseline_prediction", outcome_column
-        )
-        
-        # Use bootstrap to calculate confidence interval
-        n_bootstrap = 1000
-        bootstrap_diffs = []
-        
-        n_samples = len(treatment_data)
-        
-        for _ in range(n_bootstrap):
-            # Bootstrap sample
-            boot_indices = np.random.choice(n_samples, n_samples, replace=True)
-            boot_treatment = treatment_data.iloc[boot_indices]
-            boot_baseline = baseline_data.iloc[boot_indices]
-            
-            # Calculate performance difference
-            boot_treatment_perf = self._calculate_performance(
-                boot_treatment, "treatment_prediction", outcome_column
-            )
-            boot_baseline_perf = self._calculate_performance(
-                boot_baseline, "baseline_prediction", outcome_column
-            )
-            
-            bootstrap_diffs.append(boot_treatment_perf - boot_baseline_perf)
+    ) -> float:
+        """Calculate performance metric for predictions"""
         
-        bootstrap_diffs = np.array(bootstrap_diffs)
+        return _mean_score(self._prediction_scores(data, prediction_column, outcome_column))
+    
+    async def _calculate_significance(
+        self,
+        treatment_scores: np.ndarray,
+        baseline_scores: np.ndarray
+    ) -> Tuple[float, Tuple[float, float]]:
+        """Calculate statistical significance and confidence interval from per-row scores"""
         
-        # Calculate p-value (two-tailed test)
-        observed_diff = treatment_perf - baseline_perf
-        p_value = 2 * min(
-            (bootstrap_diffs <= 0).mean(),
-            (bootstrap_diffs >= 0).mean()
+        args = (
+            treatment_scores, baseline_scores, _N_BOOTSTRAP, _BOOTSTRAP_SEED, self.significance_level
         )
-        
-        # Calculate confidence interval
-        alpha = self.significance_level
-        ci_lower = np.percentile(bootstrap_diffs, 100 * alpha / 2)
-        ci_upper = np.percentile(bootstrap_diffs, 100 * (1 - alpha / 2))
-        
-        return p_value, (ci_lower, ci_upper)
+        if (
+            _is_binary(treatment_scores, baseline_scores)
+            or len(treatment_scores) < _BOOTSTRAP_POOL_MIN_SAMPLES
+        ):
+            # Binary and small resamples finish faster than a round-trip to a worker
+            return _bootstrap_diff(*args)
+        
+        # Keep the CPU-bound bootstrap off the event loop and outside the GIL
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_bootstrap_pool(), _bootstrap_diff, *args)
     
     async def analyze_cohort_uplift(
         self,
         treatment_run_id: str,
         cohort_definitions: Dict[str, Dict[str, Any]],
         baseline_strategy: str = "random",
-        outcome_column: str = "actual_success"
+        outcome_column: str = "actual_success",
+        cache: Optional[_RunDataCache] = None
     ) -> List[CohortUplift]:
         """
         Analyze uplift for different cohorts
@@ -301,41 +518,69 @@ class UpliftAnalyzer:
             cohort_definitions: Dict defining cohorts (e.g., {"high_price": {"feature_median_price_zip": ">500000"}})
             baseline_strategy: Baseline strategy to compare against
             outcome_column: Outcome column for measurement
+            cache: Run loads shared with sibling analyses of the same report (optional)
             
         Returns:
             List of CohortUplift results
         """
+        # Cohorts fetch the baseline run once per call, so they always share a cache
+        if cache is None:
+            cache = _RunDataCache()
+        
         # Load full dataset
-        treatment_data = await self._load_run_data(treatment_run_id, outcome_column)
+        treatment_data = await self._load_run_data(treatment_run_id, outcome_column, cache)
         
-        cohort_results = []
+        # Cohorts are independent, so overlap them up to the configured limit
+        semaphore = asyncio.Semaphore(config.max_cohort_concurrency)
         
-        for cohort_name, cohort_def in cohort_definitions.items():
-            # Filter data for this cohort
-            cohort_data = self._filter_cohort(treatment_data, cohort_def)
-            
-            if cohort_data.empty:
-                continue
-            
-            # Generate baseline for this cohort
-            cohort_baseline = await self._generate_baseline_data(
-                cohort_data, baseline_strategy, outcome_column
-            )
-            
-            # Calculate uplift for this cohort
-            uplift_results = await self._calculate_cohort_uplift(
-                cohort_data, cohort_baseline, outcome_column
-            )
-            
-            cohort_results.append(CohortUplift(
-                cohort_name=cohort_name,
-                cohort_description=str(cohort_def),
-                sample_size=len(cohort_data),
-                uplift_results=uplift_results
-            ))
+        async def bounded(cohort_name: str, cohort_def: Dict[str, Any]) -> Optional[CohortUplift]:
+            async with semaphore:
+                return await self._process_cohort(
+                    cohort_name, cohort_def, treatment_data, baseline_strategy, outcome_column, cache
+                )
+        
+        results = await asyncio.gather(*(
+            bounded(cohort_name, cohort_def)
+            for cohort_name, cohort_def in cohort_definitions.items()
+        ))
+        cohort_results = [result for result in results if result is not None]
         
         return cohort_results
     
+    async def _process_cohort(
+        self,
+        cohort_name: str,
+        cohort_def: Dict[str, Any],
+        treatment_data: pd.DataFrame,
+        baseline_strategy: str,
+        outcome_column: str,
+        cache: Optional[_RunDataCache] = None
+    ) -> Optional[CohortUplift]:
+        """Run uplift analysis for one cohort, or None if the cohort is empty"""
+        
+        # Filter data for this cohort
+        cohort_data = self._filter_cohort(treatment_data, cohort_def)
+        
+        if cohort_data.empty:
+            return None
+        
+        # Generate baseline for this cohort
+        cohort_baseline = await self._generate_baseline_data(
+            cohort_data, baseline_strategy, outcome_column, cache
+        )
+        
+        # Calculate uplift for this cohort
+        uplift_results = await self._calculate_cohort_uplift(
+            cohort_data, cohort_baseline, outcome_column
+        )
+        
+        return CohortUplift(
+            cohort_name=cohort_name,
+            cohort_description=str(cohort_def),
+            sample_size=len(cohort_data),
+            uplift_results=uplift_results
+        )
+    
     def _filter_cohort(
         self,
         data: pd.DataFrame,
@@ -343,36 +588,39 @@ class UpliftAnalyzer:
     ) -> pd.DataFrame:
         """Filter data based on cohort definition"""
         
-        filtered_data = data.copy()
+        # Combine predicates into one mask so rows are copied once, not per predicate
+        mask = np.ones(len(data), dtype=bool)
         
         for feature, condition in cohort_definition.items():
-            if feature not in filtered_data.columns:
+            if feature not in data.columns:
                 continue
             
+            values = data[feature]
+            
             if isinstance(condition, str):
                 if condition.startswith(">"):
                     threshold = float(condition[1:])
-                    filtered_data = filtered_data[filtered_data[feature] > threshold]
+                    mask &= (values > threshold).to_numpy()
                 elif condition.startswith("<"):
                     threshold = float(condition[1:])
-                    filtered_data = filtered_data[filtered_data[feature] < threshold]
+                    mask &= (values < threshold).to_numpy()
                 elif condition.startswith("=="):
                     value = condition[2:]
                     try:
                         value = float(value)
                     except ValueError:
                         pass
-                    filtered_data = filtered_data[filtered_data[feature] == value]
+                    mask &= (values == value).to_numpy()
             
             elif isinstance(condition, (list, tuple)):
                 # Range condition
                 if len(condition) == 2:
-                    filtered_data = filtered_data[
-                        (filtered_data[feature] >= condition[0]) &
-                        (filtered_data[feature] <= condition[1])
-                    ]
+                    mask &= ((values >= condition[0]) & (values <= condition[1])).to_numpy()
         
-        return filtered_data
+        if mask.all():
+            # Nothing filtered out; callers never mutate the cohort frame, so share it
+            return data
+        return data.iloc[mask]
     
     async def _calculate_cohort_uplift(
         self,
@@ -382,16 +630,19 @@ class UpliftAnalyzer:
     ) -> UpliftResults:
         """Calculate uplift for a specific cohort"""
         
-        treatment_performance = self._calculate_performance(
+        # Score each row once; performance and the bootstrap both reduce these
+        treatment_scores = self._prediction_scores(
             treatment_data, "treatment_prediction", outcome_column
         )
-        baseline_performance = self._calculate_performance(
+        baseline_scores = self._prediction_scores(
             baseline_data, "baseline_prediction", outcome_column
         )
+        treatment_performance = _mean_score(treatment_scores)
+        baseline_performance = _mean_score(baseline_scores)
         
         # Statistical significance (simplified for cohorts)
-        p_value, confidence_interval = self._calculate_significance(
-            treatment_data, baseline_data, outcome_column
+        p_value, confidence_interval = await self._calculate_significance(
+            treatment_scores, baseline_scores
         )
         
         absolute_uplift = treatment_performance - baseline_performance
@@ -414,7 +665,8 @@ class UpliftAnalyzer:
         baseline_strategy: str = "random",
         cost_per_prediction: float = 10.0,
         value_per_success: float = 5000.0,
-        cost_per_failure: float = 1000.0
+        cost_per_failure: float = 1000.0,
+        cache: Optional[_RunDataCache] = None
     ) -> Dict[str, float]:
         """
         Calculate incremental ROI of predictions vs baseline
@@ -425,27 +677,24 @@ class UpliftAnalyzer:
             cost_per_prediction: Cost to generate each prediction
             value_per_success: Value generated per successful prediction
             cost_per_failure: Cost incurred per failed prediction
+            cache: Run loads shared with sibling analyses of the same report (optional)
             
         Returns:
             Dictionary with ROI metrics
         """
         # Load data
-        treatment_data = await self._load_run_data(treatment_run_id, "actual_success")
+        treatment_data = await self._load_run_data(treatment_run_id, "actual_success", cache)
         baseline_data = await self._generate_baseline_data(
-            treatment_data, baseline_strategy, "actual_success"
+            treatment_data, baseline_strategy, "actual_success", cache
         )
         
         n_predictions = len(treatment_data)
         
         # Treatment economics
-        treatment_successes = (
-            (treatment_data["treatment_prediction"] == 1) & 
-            (treatment_data["actual_success"] == 1)
-        ).sum()
-        treatment_failures = (
-            (treatment_data["treatment_prediction"] == 1) & 
-            (treatment_data["actual_success"] == 0)
-        ).sum()
+        treatment_pred = treatment_data["treatment_prediction"].to_numpy()
+        treatment_true = treatment_data["actual_success"].to_numpy()
+        treatment_successes = _count_both(treatment_pred, treatment_true, 1)
+        treatment_failures = _count_both(treatment_pred, treatment_true, 0)
         
         treatment_revenue = treatment_successes * value_per_success
         treatment_costs = (n_predictions * cost_per_prediction + 
@@ -453,14 +702,10 @@ class UpliftAnalyzer:
         treatment_profit = treatment_revenue - treatment_costs
         
         # Baseline economics  
-        baseline_successes = (
-            (baseline_data["baseline_prediction"] == 1) & 
-            (baseline_data["actual_success"] == 1)
-        ).sum()
-        baseline_failures = (
-            (baseline_data["baseline_prediction"] == 1) & 
-            (baseline_data["actual_success"] == 0)
-        ).sum()
+        baseline_pred = baseline_data["baseline_prediction"].to_numpy()
+        baseline_true = baseline_data["actual_success"].to_numpy()
+        baseline_successes = _count_both(baseline_pred, baseline_true, 1)
+        baseline_failures = _count_both(baseline_pred, baseline_true, 0)
         
         baseline_revenue = baseline_successes * value_per_success
         baseline_costs = (n_predictions * cost_per_prediction + 
@@ -494,7 +739,8 @@ class UpliftAnalyzer:
         self,
         treatment_run_id: str,
         feature_columns: List[str],
-        outcome_column: str = "actual_success"
+        outcome_column: str = "actual_success",
+        cache: Optional[_RunDataCache] = None
     ) -> Dict[str, float]:
         """
         Analyze impact of individual features on predictions
@@ -503,21 +749,35 @@ class UpliftAnalyzer:
             Dictionary mapping feature names to impact scores
         """
         # Load data
-        treatment_data = await self._load_run_data(treatment_run_id, outcome_column)
-        
-        feature_impacts = {}
+        treatment_data = await self._load_run_data(treatment_run_id, outcome_column, cache)
+        
+        present = [feature for feature in feature_columns if feature in treatment_data.columns]
+        if not present:
+            return {}
+        
+        # Pairwise-complete Pearson correlation of every feature with the outcome in one
+        # vectorized pass; rows missing a feature are excluded for that feature only
+        features = treatment_data[present].to_numpy(dtype=np.float64)
+        outcome = treatment_data[outcome_column].to_numpy(dtype=np.float64)[:, None]
+        valid = ~np.isnan(features) & ~np.isnan(outcome)
+        counts = valid.sum(axis=0)
+        
+        with np.errstate(invalid="ignore", divide="ignore"):
+            feature_means = np.where(valid, features, 0.0).sum(axis=0) / counts
+            outcome_means = np.where(valid, outcome, 0.0).sum(axis=0) / counts
+            feature_dev = np.where(valid, features - feature_means, 0.0)
+            outcome_dev = np.where(valid, outcome - outcome_means, 0.0)
+            correlations = (feature_dev * outcome_dev).sum(axis=0) / np.sqrt(
+                (feature_dev ** 2).sum(axis=0) * (outcome_dev ** 2).sum(axis=0)
+            )
         
-        for feature in feature_columns:
-            if feature not in treatment_data.columns:
-                continue
-            
-            # Calculate correlation between feature and outcome
-            feature_values = treatment_data[feature].dropna()
-            outcome_values = treatment_data.loc[feature_values.index, outcome_column]
-            
-            if len(feature_values) > 10:
-                correlation = feature_values.corr(outcome_values)
-                feature_impacts[feature] = abs(correlation) if not pd.isna(correlation) else 0.0
+        impacts = np.nan_to_num(np.abs(correlations), nan=0.0)
+        non_null = np.count_nonzero(~np.isnan(features), axis=0)
+        feature_impacts = {
+            feature: float(impact)
+            for feature, impact, count in zip(present, impacts, non_null)
+            if count > 10
+        }
         
         return feature_impacts
     
@@ -529,9 +789,12 @@ class UpliftAnalyzer:
     ) -> Dict[str, Any]:
         """Generate comprehensive uplift analysis report"""
         
+        # Sub-analyses share one load per run; the cache is dropped when the report returns
+        cache = _RunDataCache()
+        
         # Main uplift analysis
         uplift_results = await self.calculate_uplift_vs_baseline(
-            treatment_run_id, baseline_strategy, outcome_column
+            treatment_run_id, baseline_strategy, outcome_column, cache
         )
         
         # Cohort analysis
@@ -543,17 +806,20 @@ class UpliftAnalyzer:
         }
         
         cohort_results = await self.analyze_cohort_uplift(
-            treatment_run_id, cohort_definitions, baseline_strategy, outcome_column
+            treatment_run_id, cohort_definitions, baseline_strategy, outcome_column, cache
         )
         
         # ROI analysis
-        roi_results = await self.calculate_incremental_roi(treatment_run_id, baseline_strategy)
+        roi_results = await self.calculate_incremental_roi(
+            treatment_run_id, baseline_strategy, cache=cache
+        )
         
         # Feature impact analysis
         feature_impacts = await self.analyze_feature_impact(
             treatment_run_id,
             ["feature_sqft", "feature_bedrooms", "feature_median_price_zip", "feature_mortgage_rate_30y"],
-            outcome_column
+            outcome_column,
+            cache
         )
         
         return {
@@ -3,7 +3,7 @@ CapSight Backend v2 - Main Application Module
 Production-ready real-time predictive analytics for CRE investors
 """
 
-from .core.config import settings
+from .core.config import get_settings
 from .core.utils import logger
 
 from .ingestion import StreamingIngestionService, BatchETLService
@@ -17,7 +17,7 @@ __description__ = "Real-time predictive analytics for commercial real estate arb
 
 # Export main components
 __all__ = [
-    "settings",
+    "get_settings",
     "logger", 
     "app",
     "prediction_service",
@@ -30,6 +30,4 @@ __all__ = [
 ]
 
 # Log initialization
-logger.info("CapSight Backend v2 module loaded", 
-           version=__version__,
-           environment=settings.environment)
+logger.info("CapSight Backend v2 module loaded", version=__version__)
@@ -4,8 +4,10 @@ Production-ready real-time predictive analytics for CRE investors
 """
 
 import os
+from functools import lru_cache
 from typing import Dict, List, Optional
-from pydantic import BaseSettings, Field
+from pydantic import BaseModel, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from enum import Enum
 
 class Environment(str, Enum):
@@ -36,52 +38,58 @@ class Settings(BaseSettings):
     log_level: str = Field(default="INFO")
     
     # Database
-    database_url: str = Field(..., env="DATABASE_URL")
-    redis_url: str = Field(..., env="REDIS_URL")
+    database_url: str = Field(..., validation_alias="DATABASE_URL")
+    redis_url: str = Field(..., validation_alias="REDIS_URL")
+    redis_max_connections: int = Field(default=64, validation_alias="REDIS_MAX_CONNECTIONS")
     
     # Kafka/Streaming
-    kafka_bootstrap_servers: str = Field(default="localhost:9092", env="KAFKA_BOOTSTRAP_SERVERS")
-    kafka_schema_registry_url: str = Field(default="http://localhost:8081", env="KAFKA_SCHEMA_REGISTRY_URL")
+    kafka_bootstrap_servers: str = Field(default="localhost:9092", validation_alias="KAFKA_BOOTSTRAP_SERVERS")
+    kafka_schema_registry_url: str = Field(default="http://localhost:8081", validation_alias="KAFKA_SCHEMA_REGISTRY_URL")
     
     # Feature Store
-    feast_repo_path: str = Field(default="./feature_repo", env="FEAST_REPO_PATH")
-    feast_online_store_url: str = Field(..., env="FEAST_ONLINE_STORE_URL")
+    feast_repo_path: str = Field(default="./feature_repo", validation_alias="FEAST_REPO_PATH")
+    feast_online_store_url: str = Field(..., validation_alias="FEAST_ONLINE_STORE_URL")
+    feature_fetch_concurrency: int = Field(default=16, validation_alias="FEATURE_FETCH_CONCURRENCY")
     
     # ML Models
-    mlflow_tracking_uri: str = Field(default="./mlruns", env="MLFLOW_TRACKING_URI")
-    model_registry_s3_bucket: str = Field(..., env="MODEL_REGISTRY_S3_BUCKET")
+    mlflow_tracking_uri: str = Field(default="./mlruns", validation_alias="MLFLOW_TRACKING_URI")
+    model_registry_s3_bucket: str = Field(..., validation_alias="MODEL_REGISTRY_S3_BUCKET")
     
     # External APIs
-    fred_api_key: str = Field(..., env="FRED_API_KEY")
-    bloomberg_api_key: Optional[str] = Field(None, env="BLOOMBERG_API_KEY")
-    refinitiv_api_key: Optional[str] = Field(None, env="REFINITIV_API_KEY")
-    safegraph_api_key: Optional[str] = Field(None, env="SAFEGRAPH_API_KEY")
-    google_trends_api_key: Optional[str] = Field(None, env="GOOGLE_TRENDS_API_KEY")
+    fred_api_key: str = Field(..., validation_alias="FRED_API_KEY")
+    bloomberg_api_key: Optional[str] = Field(None, validation_alias="BLOOMBERG_API_KEY")
+    refinitiv_api_key: Optional[str] = Field(None, validation_alias="REFINITIV_API_KEY")
+    safegraph_api_key: Optional[str] = Field(None, validation_alias="SAFEGRAPH_API_KEY")
+    google_trends_api_key: Optional[str] = Field(None, validation_alias="GOOGLE_TRENDS_API_KEY")
     
     # Monitoring
-    prometheus_port: int = Field(default=8000, env="PROMETHEUS_PORT")
-    grafana_dashboard_url: Optional[str] = Field(None, env="GRAFANA_DASHBOARD_URL")
-    pagerduty_api_key: Optional[str] = Field(None, env="PAGERDUTY_API_KEY")
+    prometheus_port: int = Field(default=8000, validation_alias="PROMETHEUS_PORT")
+    grafana_dashboard_url: Optional[str] = Field(None, validation_alias="GRAFANA_DASHBOARD_URL")
+    pagerduty_api_key: Optional[str] = Field(None, validation_alias="PAGERDUTY_API_KEY")
     
     # SLA Targets
     accuracy_targets: AccuracyTarget = Field(default_factory=AccuracyTarget)
     freshness_targets: FreshnessTarget = Field(default_factory=FreshnessTarget)
     
     # Security
-    jwt_secret: str = Field(..., env="JWT_SECRET")
-    api_rate_limit_per_minute: int = Field(default=100, env="API_RATE_LIMIT")
+    jwt_secret: str = Field(..., validation_alias="JWT_SECRET")
+    api_rate_limit_per_minute: int = Field(default=100, validation_alias="API_RATE_LIMIT")
     
     # Feature Flags
-    enable_challenger_models: bool = Field(default=True, env="ENABLE_CHALLENGER_MODELS")
-    enable_real_time_inference: bool = Field(default=True, env="ENABLE_REAL_TIME_INFERENCE")
-    enable_feedback_loop: bool = Field(default=True, env="ENABLE_FEEDBACK_LOOP")
+    enable_challenger_models: bool = Field(default=True, validation_alias="ENABLE_CHALLENGER_MODELS")
+    enable_real_time_inference: bool = Field(default=True, validation_alias="ENABLE_REAL_TIME_INFERENCE")
+    enable_feedback_loop: bool = Field(default=True, validation_alias="ENABLE_FEEDBACK_LOOP")
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    # Explicit env names are validation aliases; populate_by_name keeps field-name kwargs
+    # working and extra="ignore" keeps v1's tolerance of unrelated .env entries
+    model_config = SettingsConfigDict(
+        env_file=".env", case_sensitive=False, populate_by_name=True, extra="ignore"
+    )
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Process-wide settings, parsed from the environment and .env on first use"""
+    return Settings()
 
 # Kafka Topics Configuration
 KAFKA_TOPICS = {
@@ -143,14 +151,34 @@ MODEL_STAGES = {
 }
 
 # Monitoring Thresholds
-ACCURACY_ALERTS = {
-    "caprate_mae_breach": settings.accuracy_targets.caprate_mae_bps,
-    "noi_mape_breach": settings.accuracy_targets.noi_mape_percent,
-    "confidence_miscalibration": settings.accuracy_targets.confidence_calibration_tolerance
-}
+@lru_cache(maxsize=None)
+def get_accuracy_alerts() -> Dict[str, float]:
+    """Accuracy alert thresholds derived from the settings' SLA targets"""
+    settings = get_settings()
+    return {
+        "caprate_mae_breach": settings.accuracy_targets.caprate_mae_bps,
+        "noi_mape_breach": settings.accuracy_targets.noi_mape_percent,
+        "confidence_miscalibration": settings.accuracy_targets.confidence_calibration_tolerance
+    }
 
-FRESHNESS_ALERTS = {
-    "treasury_stale_minutes": settings.freshness_targets.intraday_rates_minutes,
-    "mortgage_stale_minutes": settings.freshness_targets.hourly_mortgage_minutes, 
-    "mobility_stale_hours": settings.freshness_targets.daily_signals_hours
+@lru_cache(maxsize=None)
+def get_freshness_alerts() -> Dict[str, int]:
+    """Freshness alert thresholds derived from the settings' SLA targets"""
+    settings = get_settings()
+    return {
+        "treasury_stale_minutes": settings.freshness_targets.intraday_rates_minutes,
+        "mortgage_stale_minutes": settings.freshness_targets.hourly_mortgage_minutes, 
+        "mobility_stale_hours": settings.freshness_targets.daily_signals_hours
+    }
+
+_LAZY_ATTRIBUTES = {
+    "settings": get_settings,
+    "ACCURACY_ALERTS": get_accuracy_alerts,
+    "FRESHNESS_ALERTS": get_freshness_alerts
 }
+
+def __getattr__(name: str):
+    # Former eager module globals, now built on first access
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,6 +9,7 @@ import logging
 import sys
 from typing import Dict, Any, Optional, List, Union, Callable, TypeVar
 from datetime import datetime, timezone
+from enum import IntEnum
 from contextlib import asynccontextmanager
 from functools import wraps
 
@@ -120,30 +121,41 @@ class HealthCheck(BaseModel):
 # Decorators and utilities
 
 def track_execution_time(metric_name: str, labels: Optional[Dict[str, str]] = None):
-    """Decorator to track execution time with Prometheus metrics"""
+    """Decorator to track execution time with Prometheus metrics
+    
+    Labelled metric children are resolved once at decoration time, so each call
+    skips the label hashing and child lookup.
+    """
     def decorator(func: Callable):
+        metric = METRICS[metric_name]
+        label_names = getattr(metric, "_labelnames", ())
+        static_labels = labels or {}
+        observer = metric.labels(**static_labels) if label_names else metric
+        # Failures get their own child only where the metric registers a status label
+        error_observer = (
+            metric.labels(**static_labels, status="error") if "status" in label_names else observer
+        )
+        
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            labels_dict = labels or {}
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = await func(*args, **kwargs)
-                METRICS[metric_name].labels(**labels_dict).observe(time.time() - start_time)
+                observer.observe(time.perf_counter() - start_time)
                 return result
             except Exception as e:
-                METRICS[metric_name].labels(**labels_dict, status="error").observe(time.time() - start_time)
+                error_observer.observe(time.perf_counter() - start_time)
                 raise
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            labels_dict = labels or {}
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                METRICS[metric_name].labels(**labels_dict).observe(time.time() - start_time)
+                observer.observe(time.perf_counter() - start_time)
                 return result
             except Exception as e:
-                METRICS[metric_name].labels(**labels_dict, status="error").observe(time.time() - start_time)
+                error_observer.observe(time.perf_counter() - start_time)
                 raise
         
         return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
@@ -152,23 +164,48 @@ def track_execution_time(metric_name: str, labels: Optional[Dict[str, str]] = No
 
 def validate_data_freshness(max_age_seconds: int):
     """Decorator to validate data freshness before processing"""
+    max_age = float(max_age_seconds)
+    gauge = METRICS["data_freshness_seconds"]
+    source_gauges: Dict[str, Any] = {}
+    
+    def check_freshness(args: tuple) -> None:
+        # Extract timestamp from first argument if it's a TimestampedData instance
+        if args and isinstance(args[0], TimestampedData):
+            data = args[0]
+            now = datetime.now(timezone.utc)
+            data_age = (now - data.timestamp).total_seconds()
+            if data_age > max_age:
+                raise ValueError(f"Data is {data_age:.0f}s old, exceeds {max_age_seconds}s threshold")
+            
+            # Update freshness metric
+            source_gauge = source_gauges.get(data.source)
+            if source_gauge is None:
+                source_gauge = source_gauges[data.source] = gauge.labels(source=data.source)
+            source_gauge.set(data_age)
+    
     def decorator(func: Callable):
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                check_freshness(args)
+                return await func(*args, **kwargs)
+            return async_wrapper
+        
         @wraps(func)
-        async def wrapper(*args, **kwargs):
-            # Extract timestamp from first argument if it's a TimestampedData instance
-            if args and isinstance(args[0], TimestampedData):
-                data_age = (datetime.now(timezone.utc) - args[0].timestamp).total_seconds()
-                if data_age > max_age_seconds:
-                    raise ValueError(f"Data is {data_age:.0f}s old, exceeds {max_age_seconds}s threshold")
-                    
-                # Update freshness metric
-                METRICS["data_freshness_seconds"].labels(source=args[0].source).set(data_age)
-            
-            return await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-        return wrapper
+        def sync_wrapper(*args, **kwargs):
+            check_freshness(args)
+            return func(*args, **kwargs)
+        return sync_wrapper
     return decorator
 
 
+class CircuitState(IntEnum):
+    """Circuit breaker states"""
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
 class Circuit:
     """Circuit breaker for external service calls"""
     
@@ -178,35 +215,53 @@ class Circuit:
         self.expected_exception = expected_exception
         self.failure_count = 0
         self.last_failure_time = None
-        self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
+        self.state = CircuitState.CLOSED
     
     def __call__(self, func: Callable):
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            if self.state == 'OPEN':
-                if time.time() - self.last_failure_time > self.recovery_timeout:
-                    self.state = 'HALF_OPEN'
-                else:
-                    raise Exception(f"Circuit breaker is OPEN for {func.__name__}")
-            
+            is_probe = self._admit(func.__name__)
             try:
-                result = await func(*args, **kwargs) if asyncio.iscoroutinefunction(func) else func(*args, **kwargs)
-                self._on_success()
-                return result
+                result = await func(*args, **kwargs) if is_coroutine else func(*args, **kwargs)
             except self.expected_exception as e:
                 self._on_failure()
                 raise
+            except BaseException:
+                # Probe ended without a verdict (e.g. cancelled); let the next call probe instead
+                if is_probe and self.state is CircuitState.HALF_OPEN:
+                    self.state = CircuitState.OPEN
+                raise
+            self._on_success()
+            return result
         return wrapper
     
+    def _admit(self, name: str) -> bool:
+        """Check whether a call may proceed; returns True if it is the half-open probe.
+        
+        Every transition here happens without an await in between, so concurrent
+        coroutines always see a consistent state and only one of them probes.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return False
+        if state is CircuitState.OPEN and time.monotonic() - self.last_failure_time > self.recovery_timeout:
+            self.state = CircuitState.HALF_OPEN
+            return True
+        raise Exception(f"Circuit breaker is OPEN for {name}")
+    
     def _on_success(self):
-        self.failure_count = 0
-        self.state = 'CLOSED'
+        # Common case: already closed with no failures, nothing to write
+        if self.failure_count or self.state is not CircuitState.CLOSED:
+            self.failure_count = 0
+            self.state = CircuitState.CLOSED
     
     def _on_failure(self):
         self.failure_count += 1
-        self.last_failure_time = time.time()
-        if self.failure_count >= self.failure_threshold:
-            self.state = 'OPEN'
+        self.last_failure_time = time.monotonic()
+        if self.state is CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            self.state = CircuitState.OPEN
 
 
 class BatchProcessor:
@@ -216,22 +271,23 @@ class BatchProcessor:
         self.batch_size = batch_size
         self.flush_interval = flush_interval
         self.batch = []
-        self.last_flush = time.time()
-        self.lock = asyncio.Lock()
+        self.last_flush = time.monotonic()
     
     async def add(self, item: Any):
-        async with self.lock:
-            self.batch.append(item)
-            if len(self.batch) >= self.batch_size or (time.time() - self.last_flush) > self.flush_interval:
-                await self._flush()
+        # Append and buffer swap run without an await in between, so they are atomic on the
+        # event loop; the sink is awaited after the swap and never blocks other producers
+        self.batch.append(item)
+        if len(self.batch) >= self.batch_size or (time.monotonic() - self.last_flush) > self.flush_interval:
+            batch_to_process, self.batch = self.batch, []
+            self.last_flush = time.monotonic()
+            await self._process_batch(batch_to_process)
     
     async def _flush(self):
         if not self.batch:
             return
         
-        batch_to_process = self.batch.copy()
-        self.batch.clear()
-        self.last_flush = time.time()
+        batch_to_process, self.batch = self.batch, []
+        self.last_flush = time.monotonic()
         
         # Process batch (override in subclass)
         await self._process_batch(batch_to_process)
@@ -247,15 +303,15 @@ def calculate_data_freshness_score(timestamps: List[datetime], weights: Optional
         return 0.0
     
     now = datetime.now(timezone.utc)
-    ages_hours = [(now - ts).total_seconds() / 3600 for ts in timestamps]
-    
-    if weights is None:
-        weights = [1.0] * len(ages_hours)
+    ts_arr = np.fromiter((ts.timestamp() for ts in timestamps), dtype=np.float64, count=len(timestamps))
+    ages_hours = (now.timestamp() - ts_arr) * (1.0 / 3600.0)
     
     # Exponential decay: score = exp(-age_hours / 24)
-    scores = [np.exp(-age / 24) for age in ages_hours]
-    weighted_score = np.average(scores, weights=weights)
+    scores = np.exp(ages_hours * (-1.0 / 24.0))
+    if weights is None:
+        return float(scores.mean())
     
+    weighted_score = np.average(scores, weights=np.asarray(weights, dtype=np.float64))
     return float(weighted_score)
 
 
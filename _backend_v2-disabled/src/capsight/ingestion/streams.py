@@ -4,13 +4,16 @@ Handles real-time streaming (Kafka) and batch ETL processes
 """
 
 import asyncio
-import json
-from typing import Dict, Any, List, Optional, Callable
+import os
+import time
+from typing import Dict, Any, List, Optional, Callable, BinaryIO, Tuple
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
-from ..core.config import settings, KAFKA_TOPICS
+import orjson
+
+from ..core.config import get_settings, KAFKA_TOPICS
 from ..core.utils import logger, METRICS, TimestampedData, Circuit, retry_with_backoff
 
 # Mock imports (will resolve when requirements are installed)
@@ -19,11 +22,38 @@ try:
     from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
     import aiohttp
     import pandas as pd
+    import numpy as np
 except ImportError:
     pass
 
 
-@dataclass
+# Local file queue used when Kafka is unavailable
+_LOCAL_QUEUE_DIR = "data_queue"
+_LOCAL_QUEUE_MAXSIZE = 10_000
+_LOCAL_QUEUE_FSYNC_EVERY = 500
+_LOCAL_QUEUE_FSYNC_SECONDS = 5.0
+
+# Kafka topic for each data type
+_TOPIC_MAPPING = {
+    "treasury": KAFKA_TOPICS["treasury_rates"],
+    "credit": KAFKA_TOPICS["mbs_spreads"],
+    "equity": KAFKA_TOPICS["reit_data"],
+    "mobility": KAFKA_TOPICS["mobility_data"]
+}
+
+# Resolved data_ingestion_rate children, keyed by (source, status)
+_INGESTION_COUNTERS: Dict[Tuple[str, str], Any] = {}
+
+
+def _ingestion_counter(source: str, status: str):
+    """Return the data_ingestion_rate child for a source/status pair, resolving it once"""
+    counter = _INGESTION_COUNTERS.get((source, status))
+    if counter is None:
+        counter = _INGESTION_COUNTERS[(source, status)] = METRICS["data_ingestion_rate"].labels(source=source, status=status)
+    return counter
+
+
+@dataclass(slots=True)
 class MarketDataPoint:
     """Standardized market data point"""
     symbol: str
@@ -42,17 +72,36 @@ class DataSource(ABC):
         self.update_frequency = update_frequency_seconds
         self.last_update = None
         self.circuit = Circuit(failure_threshold=3, recovery_timeout=300)
+        self._ingest_error = _ingestion_counter(source_name, "error")
+        self._freshness = METRICS["data_freshness_seconds"].labels(source=source_name)
+        self.http = None  # Shared aiohttp.ClientSession, set by StreamingIngestionService.start
+    
+    @property
+    def last_update(self) -> Optional[datetime]:
+        return self._last_update
+    
+    @last_update.setter
+    def last_update(self, value: Optional[datetime]):
+        # Sources assign this right after a fetch, so pair it with a monotonic reading for age checks
+        self._last_update = value
+        self._last_update_mono = time.monotonic() if value is not None else None
     
     @abstractmethod
     async def fetch_data(self) -> List[MarketDataPoint]:
         """Fetch data from the source"""
         pass
     
-    async def is_stale(self) -> bool:
+    def age_seconds(self, now_mono: Optional[float] = None) -> Optional[float]:
+        """Seconds since the last successful update, on the monotonic clock"""
+        if self._last_update_mono is None:
+            return None
+        return (time.monotonic() if now_mono is None else now_mono) - self._last_update_mono
+    
+    async def is_stale(self, now_mono: Optional[float] = None) -> bool:
         """Check if data source is stale based on SLA"""
-        if not self.last_update:
+        age = self.age_seconds(now_mono)
+        if age is None:
             return True
-        age = (datetime.now(timezone.utc) - self.last_update).total_seconds()
         return age > self.update_frequency * 2
 
 
@@ -72,48 +121,75 @@ class TreasuryRateSource(DataSource):
     @retry_with_backoff(max_retries=3)
     async def fetch_data(self) -> List[MarketDataPoint]:
         """Fetch Treasury rates from FRED API"""
-        data_points = []
-        
         try:
             # Mock FRED API call (replace with actual fredapi client)
-            async with aiohttp.ClientSession() as session:
-                for fred_code, capsight_name in self.fred_series.items():
-                    url = f"https://api.stlouisfed.org/fred/series/observations"
-                    params = {
-                        "series_id": fred_code,
-                        "api_key": settings.fred_api_key,
-                        "file_type": "json",
-                        "limit": 1,
-                        "sort_order": "desc"
-                    }
-                    
-                    async with session.get(url, params=params) as response:
-                        if response.status == 200:
-                            json_data = await response.json()
-                            observations = json_data.get("observations", [])
-                            
-                            if observations:
-                                latest = observations[0]
-                                value = float(latest["value"]) if latest["value"] != "." else None
-                                
-                                if value is not None:
-                                    data_points.append(MarketDataPoint(
-                                        symbol=capsight_name,
-                                        value=value,
-                                        timestamp=datetime.fromisoformat(latest["date"]).replace(tzinfo=timezone.utc),
-                                        source="fred",
-                                        data_type="treasury",
-                                        metadata={"fred_series_id": fred_code}
-                                    ))
+            if self.http is not None:
+                results = await self._fetch_all(self.http)
+            else:
+                async with aiohttp.ClientSession() as session:
+                    results = await self._fetch_all(session)
+            
+            data_points = []
+            errors = []
+            for fred_code, result in zip(self.fred_series, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to fetch Treasury series", fred_series_id=fred_code, error=str(result))
+                    errors.append(result)
+                elif result is not None:
+                    data_points.append(result)
+            
+            if errors and len(errors) == len(results):
+                raise errors[0]
         
         except Exception as e:
             logger.error("Failed to fetch Treasury data", error=str(e), source=self.source_name)
-            METRICS["data_ingestion_rate"].labels(source="fred", status="error").inc()
+            _ingestion_counter("fred", "error").inc()
             raise
         
         self.last_update = datetime.now(timezone.utc)
-        METRICS["data_ingestion_rate"].labels(source="fred", status="success").inc(len(data_points))
+        _ingestion_counter("fred", "success").inc(len(data_points))
         return data_points
+    
+    async def _fetch_all(self, session) -> List[Any]:
+        """Request every series concurrently; failures come back as exceptions in place"""
+        return await asyncio.gather(
+            *(self._fetch_one(session, fred_code, capsight_name) for fred_code, capsight_name in self.fred_series.items()),
+            return_exceptions=True
+        )
+    
+    async def _fetch_one(self, session, fred_code: str, capsight_name: str) -> Optional[MarketDataPoint]:
+        """Fetch the latest observation for a single FRED series"""
+        url = f"https://api.stlouisfed.org/fred/series/observations"
+        params = {
+            "series_id": fred_code,
+            "api_key": get_settings().fred_api_key,
+            "file_type": "json",
+            "limit": 1,
+            "sort_order": "desc"
+        }
+        
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                return None
+            json_data = await response.json()
+        
+        observations = json_data.get("observations", [])
+        if not observations:
+            return None
+        
+        latest = observations[0]
+        value = float(latest["value"]) if latest["value"] != "." else None
+        if value is None:
+            return None
+        
+        return MarketDataPoint(
+            symbol=capsight_name,
+            value=value,
+            timestamp=datetime.fromisoformat(latest["date"]).replace(tzinfo=timezone.utc),
+            source="fred",
+            data_type="treasury",
+            metadata={"fred_series_id": fred_code}
+        )
 
 
 class CreditSpreadSource(DataSource):
@@ -249,7 +325,15 @@ class StreamingIngestionService:
             MobilityDataSource()
         ]
         self.producer = None
+        self.http = None
         self.running = False
+        
+        # Local queue fallback: one append-only handle per topic, fed by a single writer task
+        self._queue_files: Dict[str, BinaryIO] = {}
+        self._queue_chan: asyncio.Queue = asyncio.Queue(maxsize=_LOCAL_QUEUE_MAXSIZE)
+        self._queue_writer_task: Optional[asyncio.Task] = None
+        self._queue_unsynced = 0
+        self._queue_synced_at = time.monotonic()
     
     async def start(self):
         """Start all data ingestion streams"""
@@ -258,8 +342,8 @@ class StreamingIngestionService:
         # Initialize Kafka producer
         try:
             self.producer = AIOKafkaProducer(
-                bootstrap_servers=settings.kafka_bootstrap_servers,
-                value_serializer=lambda v: json.dumps(v).encode()
+                bootstrap_servers=get_settings().kafka_bootstrap_servers,
+                value_serializer=orjson.dumps
             )
             await self.producer.start()
         except Exception as e:
@@ -267,7 +351,13 @@ class StreamingIngestionService:
             # Fallback to file-based queue
             self.producer = None
         
+        # One keep-alive HTTP pool shared by every source
+        self.http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=50, ttl_dns_cache=300))
+        for source in self.sources:
+            source.http = self.http
+        
         self.running = True
+        self._ensure_queue_writer()
         
         # Start ingestion tasks for each source
         tasks = []
@@ -289,6 +379,15 @@ class StreamingIngestionService:
         self.running = False
         if self.producer:
             await self.producer.stop()
+        if self.http:
+            for source in self.sources:
+                source.http = None
+            await self.http.close()
+            self.http = None
+        if self._queue_writer_task and not self._queue_writer_task.done():
+            # Sentinel lets the writer drain what is already queued before closing files
+            await self._queue_chan.put(None)
+            await self._queue_writer_task
         logger.info("Streaming ingestion service stopped")
     
     async def _run_source_ingestion(self, source: DataSource):
@@ -298,9 +397,8 @@ class StreamingIngestionService:
                 # Fetch data from source
                 data_points = await source.fetch_data()
                 
-                # Stream to Kafka
-                for point in data_points:
-                    await self._stream_data_point(point)
+                # Stream to Kafka, one batch per topic
+                await self._stream_data_points(data_points)
                 
                 logger.debug("Ingested data", 
                            source=source.source_name, 
@@ -310,51 +408,90 @@ class StreamingIngestionService:
                 logger.error("Source ingestion failed", 
                            source=source.source_name, 
                            error=str(e))
-                METRICS["data_ingestion_rate"].labels(
-                    source=source.source_name, 
-                    status="error"
-                ).inc()
+                source._ingest_error.inc()
             
             # Wait for next update
             await asyncio.sleep(source.update_frequency)
     
-    async def _stream_data_point(self, point: MarketDataPoint):
-        """Stream individual data point to appropriate Kafka topic"""
-        
-        # Determine topic based on data type
-        topic_mapping = {
-            "treasury": KAFKA_TOPICS["treasury_rates"],
-            "credit": KAFKA_TOPICS["mbs_spreads"],  
-            "equity": KAFKA_TOPICS["reit_data"],
-            "mobility": KAFKA_TOPICS["mobility_data"]
-        }
-        
-        topic = topic_mapping.get(point.data_type)
-        if not topic:
+    @staticmethod
+    def _topic_for(point: MarketDataPoint) -> Optional[str]:
+        """Resolve the Kafka topic for a data point's type"""
+        try:
+            return _TOPIC_MAPPING[point.data_type]
+        except KeyError:
             logger.warn("Unknown data type", data_type=point.data_type)
-            return
-        
-        # Prepare message
-        message = {
+            return None
+    
+    @staticmethod
+    def _build_message(point: MarketDataPoint) -> Dict[str, Any]:
+        """Build the Kafka message payload for a data point"""
+        return {
             "symbol": point.symbol,
             "value": point.value,
-            "timestamp": point.timestamp.isoformat(),
+            "timestamp": point.timestamp,
             "source": point.source,
             "data_type": point.data_type,
             "metadata": point.metadata
         }
+    
+    async def _stream_data_points(self, points: List[MarketDataPoint]):
+        """Stream a fetch cycle's data points with one Kafka batch per topic"""
+        buckets: Dict[tuple, List[Dict[str, Any]]] = {}
+        for point in points:
+            topic = self._topic_for(point)
+            if topic:
+                buckets.setdefault((topic, point.source), []).append(self._build_message(point))
         
-        try:
-            if self.producer:
-                await self.producer.send(topic, message)
-            else:
-                # Fallback: write to local queue file
-                await self._write_to_local_queue(topic, message)
+        for (topic, source), messages in buckets.items():
+            try:
+                if self.producer:
+                    await self._send_batch(topic, messages)
+                else:
+                    # Fallback: write to local queue file
+                    for message in messages:
+                        await self._write_to_local_queue(topic, message)
                 
-            METRICS["data_ingestion_rate"].labels(
-                source=point.source, 
-                status="success"
-            ).inc()
+                _ingestion_counter(source, "success").inc(len(messages))
+            
+            except Exception as e:
+                logger.error("Failed to stream data batch", 
+                            topic=topic, 
+                            point_count=len(messages), 
+                            error=str(e))
+                raise
+    
+    async def _send_batch(self, topic: str, messages: List[Dict[str, Any]]):
+        """Send messages to a topic, starting a new batch whenever one fills up"""
+        batch = self.producer.create_batch()
+        for message in messages:
+            value = orjson.dumps(message)
+            if batch.append(key=None, value=value, timestamp=None) is not None:
+                continue
+            
+            # Batch full: send it and retry the message in a fresh one
+            if batch.record_count():
+                await self.producer.send_batch(batch, topic, partition=None)
+                batch = self.producer.create_batch()
+                if batch.append(key=None, value=value, timestamp=None) is not None:
+                    continue
+            
+            # Larger than an empty batch can hold: send it alone rather than drop it
+            await self.producer.send(topic, message)
+        
+        if batch.record_count():
+            await self.producer.send_batch(batch, topic, partition=None)
+    
+    async def _stream_data_point(self, point: MarketDataPoint):
+        """Stream individual data point to appropriate Kafka topic"""
+        topic = self._topic_for(point)
+        if not topic:
+            return
+        
+        message = self._build_message(point)
+        
+        try:
+            await self._publish(topic, message)
+            _ingestion_counter(point.source, "success").inc()
             
         except Exception as e:
             logger.error("Failed to stream data point", 
@@ -362,29 +499,97 @@ class StreamingIngestionService:
                         error=str(e))
             raise
     
+    async def _publish(self, topic: str, message: Dict[str, Any]):
+        """Send a single message to Kafka, or to the local queue when Kafka is unavailable"""
+        if self.producer:
+            await self.producer.send(topic, message)
+        else:
+            # Fallback: write to local queue file
+            await self._write_to_local_queue(topic, message)
+    
     async def _write_to_local_queue(self, topic: str, message: Dict[str, Any]):
-        """Fallback: write to local file queue when Kafka unavailable"""
-        import os
-        queue_dir = "data_queue"
-        os.makedirs(queue_dir, exist_ok=True)
+        """Fallback: queue message for the local file writer when Kafka unavailable"""
+        self._ensure_queue_writer()
+        await self._queue_chan.put((topic, orjson.dumps(message)))
+    
+    def _ensure_queue_writer(self):
+        """Start the local queue writer task if it is not already running"""
+        if self._queue_writer_task is None or self._queue_writer_task.done():
+            self._queue_writer_task = asyncio.create_task(self._queue_writer())
+    
+    async def _queue_writer(self):
+        """Drain queued messages to disk in batches, off the event loop"""
+        try:
+            while True:
+                batch = [await self._queue_chan.get()]
+                while not self._queue_chan.empty():
+                    batch.append(self._queue_chan.get_nowait())
+                
+                try:
+                    await asyncio.to_thread(self._write_queue_batch, [item for item in batch if item is not None])
+                except Exception as e:
+                    logger.error("Failed to write local queue batch", message_count=len(batch), error=str(e))
+                finally:
+                    for _ in batch:
+                        self._queue_chan.task_done()
+                
+                if None in batch:
+                    break
+        finally:
+            await asyncio.to_thread(self._close_queue_files)
+    
+    def _write_queue_batch(self, batch: List[Tuple[str, bytes]]):
+        """Append a batch of serialized messages to their topic files (runs in a worker thread)"""
+        day = datetime.now().strftime('%Y%m%d')
+        touched = set()
+        
+        for topic, payload in batch:
+            filename = f"{_LOCAL_QUEUE_DIR}/{topic}_{day}.jsonl"
+            f = self._queue_files.get(topic)
+            if f is None or f.name != filename:
+                # First write for this topic, or the day rolled over
+                if f is not None:
+                    f.close()
+                os.makedirs(_LOCAL_QUEUE_DIR, exist_ok=True)
+                f = self._queue_files[topic] = open(filename, "ab")
+            
+            f.write(payload + b"\n")
+            touched.add(f)
+        
+        for f in touched:
+            f.flush()
         
-        filename = f"{queue_dir}/{topic}_{datetime.now().strftime('%Y%m%d')}.jsonl"
-        with open(filename, "a") as f:
-            f.write(json.dumps(message) + "\n")
+        self._queue_unsynced += len(batch)
+        now = time.monotonic()
+        if self._queue_unsynced >= _LOCAL_QUEUE_FSYNC_EVERY or now - self._queue_synced_at >= _LOCAL_QUEUE_FSYNC_SECONDS:
+            for f in self._queue_files.values():
+                os.fsync(f.fileno())
+            self._queue_unsynced = 0
+            self._queue_synced_at = now
+    
+    def _close_queue_files(self):
+        """Sync and close all open local queue files"""
+        for f in self._queue_files.values():
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        self._queue_files.clear()
+        self._queue_unsynced = 0
     
     async def _monitor_data_freshness(self):
         """Monitor data freshness and alert on SLA violations"""
         while self.running:
+            now_mono = time.monotonic()
             for source in self.sources:
-                if await source.is_stale():
+                if await source.is_stale(now_mono):
                     logger.warning("Data source is stale", 
                                  source=source.source_name,
                                  last_update=source.last_update)
                     
                     # Update freshness metric  
-                    if source.last_update:
-                        age = (datetime.now(timezone.utc) - source.last_update).total_seconds()
-                        METRICS["data_freshness_seconds"].labels(source=source.source_name).set(age)
+                    age = source.age_seconds(now_mono)
+                    if age is not None:
+                        source._freshness.set(age)
             
             await asyncio.sleep(60)  # Check every minute
 
@@ -392,8 +597,11 @@ class StreamingIngestionService:
 class BatchETLService:
     """Batch ETL for historical data backfill and daily aggregations"""
     
-    def __init__(self):
+    def __init__(self, ingestion_service: Optional[StreamingIngestionService] = None):
         self.batch_size = 1000
+        # Streams through the caller's service when given; otherwise owns one for its own runs
+        self._owns_ingestion_service = ingestion_service is None
+        self.ingestion_service = ingestion_service or StreamingIngestionService()
     
     async def backfill_treasury_data(self, start_date: datetime, end_date: datetime):
         """Backfill historical Treasury rates"""
@@ -401,41 +609,35 @@ class BatchETLService:
                    start=start_date.isoformat(), 
                    end=end_date.isoformat())
         
-        # Mock backfill implementation
-        current = start_date
-        batch = []
-        
-        while current <= end_date:
-            # Mock historical data point
-            data_point = MarketDataPoint(
-                symbol="treasury_10y_rate",
-                value=4.5 + (current.timestamp() % 100) / 1000,  # Mock variation
-                timestamp=current,
-                source="fred_historical",
-                data_type="treasury",
-                metadata={"backfill": True}
-            )
-            
-            batch.append(data_point)
-            
-            if len(batch) >= self.batch_size:
-                await self._process_batch(batch)
-                batch = []
-            
-            current += timedelta(days=1)
+        # Mock backfill implementation: build the whole day range and its values up front
+        dates = pd.date_range(start_date, end_date, freq="D").to_pydatetime()
+        ts_seconds = start_date.timestamp() + 86400.0 * np.arange(len(dates))
+        values = (4.5 + (ts_seconds % 100) / 1000).tolist()  # Mock variation
         
-        # Process remaining batch
-        if batch:
+        for offset in range(0, len(dates), self.batch_size):
+            batch = [
+                MarketDataPoint(
+                    symbol="treasury_10y_rate",
+                    value=value,
+                    timestamp=timestamp,
+                    source="fred_historical",
+                    data_type="treasury",
+                    metadata={"backfill": True}
+                )
+                for timestamp, value in zip(dates[offset:offset + self.batch_size], values[offset:offset + self.batch_size])
+            ]
             await self._process_batch(batch)
         
+        if self._owns_ingestion_service:
+            # Drains the local queue fallback; the service restarts its writer on next use
+            await self.ingestion_service.stop()
+        
         logger.info("Treasury data backfill completed")
     
     async def _process_batch(self, batch: List[MarketDataPoint]):
         """Process batch of data points"""
-        # Stream to appropriate topics
-        ingestion_service = StreamingIngestionService()
-        for point in batch:
-            await ingestion_service._stream_data_point(point)
+        # Stream to appropriate topics, one Kafka batch per topic
+        await self.ingestion_service._stream_data_points(batch)
 
 
 # Export main services
@@ -9,7 +9,7 @@ from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass, field
 
-from ..core.config import settings, FEATURE_GROUPS
+from ..core.config import get_settings, FEATURE_GROUPS
 from ..core.utils import logger, METRICS, track_execution_time, validate_data_freshness
 
 # Mock imports - will resolve when requirements installed
@@ -197,13 +197,13 @@ class FeatureStoreService:
         """Initialize Feast feature store"""
         try:
             # Initialize Feast (mock implementation)
-            logger.info("Initializing Feast feature store", repo_path=settings.feast_repo_path)
+            logger.info("Initializing Feast feature store", repo_path=get_settings().feast_repo_path)
             
             # Create feature store repository structure
             await self._setup_feature_definitions()
             
             # In production, would use:
-            # self.feast_store = FeatureStore(repo_path=settings.feast_repo_path)
+            # self.feast_store = FeatureStore(repo_path=get_settings().feast_repo_path)
             
             logger.info("Feature store initialized successfully")
             
@@ -214,6 +214,22 @@ class FeatureStoreService:
     @track_execution_time("feature_retrieval_duration", {"feature_group": "all"})
     async def get_features(self, request: FeatureRequest) -> FeatureResponse:
         """Retrieve features for entities"""
+        return await self._get_features(request)
+    
+    @track_execution_time("feature_retrieval_duration", {"feature_group": "batch"})
+    async def get_features_batch(self, requests: List[FeatureRequest]) -> List[FeatureResponse]:
+        """Retrieve features for many entity requests in one store pass
+        
+        Feature groups keyed only by date (treasury, credit) or by market are
+        computed once per distinct key and shared across the batch.
+        """
+        group_cache: Dict[Any, Any] = {}
+        return [await self._get_features(request, group_cache) for request in requests]
+    
+    async def _get_features(
+        self, request: FeatureRequest, group_cache: Optional[Dict[Any, Any]] = None
+    ) -> FeatureResponse:
+        """Retrieve features for one request, reusing group results from group_cache"""
         start_time = datetime.now()
         
         # Check cache first
@@ -249,19 +265,16 @@ class FeatureStoreService:
             timestamp = datetime.fromisoformat(date) if isinstance(date, str) else date
             
             # Treasury features (date-only entity)
-            treasury_raw = await self._get_raw_market_data("treasury", timestamp)
-            treasury_features = await self.feature_computer.compute_treasury_features(treasury_raw, timestamp)
+            treasury_features = await self._get_group_features(group_cache, "treasury", timestamp)
             features.update(treasury_features)
             
             # Credit features (date-only entity)  
-            credit_raw = await self._get_raw_market_data("credit", timestamp)
-            credit_features = await self.feature_computer.compute_credit_features(credit_raw, timestamp)
+            credit_features = await self._get_group_features(group_cache, "credit", timestamp)
             features.update(credit_features)
             
             # Market features (market_id + date entities)
             for market_id in market_ids:
-                market_raw = await self._get_raw_market_data("market", timestamp, market_id)
-                market_features = await self.feature_computer.compute_market_features(market_id, market_raw, timestamp)
+                market_features = await self._get_group_features(group_cache, "market", timestamp, market_id)
                 
                 # Prefix with market_id
                 for feature_name, value in market_features.items():
@@ -302,6 +315,30 @@ class FeatureStoreService:
         
         return response
     
+    async def _get_group_features(
+        self,
+        group_cache: Optional[Dict[Any, Any]],
+        data_type: str,
+        timestamp: datetime,
+        entity_id: Optional[str] = None
+    ) -> Dict[str, float]:
+        """Compute a shared feature group once per (type, timestamp, entity) within a batch"""
+        key = (data_type, timestamp, entity_id)
+        if group_cache is not None and key in group_cache:
+            return group_cache[key]
+        
+        raw_data = await self._get_raw_market_data(data_type, timestamp, entity_id)
+        if data_type == "treasury":
+            group_features = await self.feature_computer.compute_treasury_features(raw_data, timestamp)
+        elif data_type == "credit":
+            group_features = await self.feature_computer.compute_credit_features(raw_data, timestamp)
+        else:
+            group_features = await self.feature_computer.compute_market_features(entity_id, raw_data, timestamp)
+        
+        if group_cache is not None:
+            group_cache[key] = group_features
+        return group_features
+    
     async def _get_raw_market_data(self, data_type: str, timestamp: datetime, entity_id: Optional[str] = None) -> Dict[str, float]:
         """Retrieve raw market data (mock implementation)"""
         
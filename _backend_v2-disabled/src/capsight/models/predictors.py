@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
-from ..core.config import settings, MODEL_STAGES, ACCURACY_ALERTS
+from ..core.config import get_settings, MODEL_STAGES
 from ..core.utils import logger, METRICS, track_execution_time, PredictionResult
 from .feature_store import FeatureStoreService, FeatureRequest
 
@@ -69,9 +69,13 @@ class BaseModel(ABC):
         """Train the model"""
         pass
     
+    async def predict(self, *args, **kwargs) -> Tuple[Any, Dict[str, Any]]:
+        """Make predictions with metadata, running predict_sync in a worker thread off the event loop"""
+        return await asyncio.to_thread(self.predict_sync, *args, **kwargs)
+    
     @abstractmethod
-    async def predict(self, X: np.ndarray, **kwargs) -> Tuple[np.ndarray, Dict[str, Any]]:
-        """Make predictions with metadata"""
+    def predict_sync(self, *args, **kwargs) -> Tuple[Any, Dict[str, Any]]:
+        """Blocking prediction with metadata"""
         pass
     
     async def explain_prediction(self, X: np.ndarray, max_features: int = 10) -> Dict[str, Any]:
@@ -176,7 +180,7 @@ class CapRatePredictor(BaseModel):
         self.conformal_predictor = MapieRegressor(wrapped_model, cv=5)
         
         # Calculate performance metrics
-        ensemble_pred = await self._ensemble_predict(X)
+        ensemble_pred = self._ensemble_predict(X)
         mae = np.mean(np.abs(ensemble_pred - y))
         rmse = np.sqrt(np.mean((ensemble_pred - y) ** 2))
         
@@ -192,11 +196,11 @@ class CapRatePredictor(BaseModel):
         logger.info("Cap rate model training completed", **metrics)
         return metrics
     
-    async def predict(self, X: np.ndarray, include_uncertainty: bool = True) -> Tuple[np.ndarray, Dict[str, Any]]:
-        """Make cap rate predictions with uncertainty intervals"""
+    def predict_sync(self, X: np.ndarray, include_uncertainty: bool = True) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Blocking cap rate prediction with uncertainty intervals"""
         
         # Ensemble prediction
-        predictions = await self._ensemble_predict(X)
+        predictions = self._ensemble_predict(X)
         
         metadata = {
             "model_name": self.model_name,
@@ -221,7 +225,7 @@ class CapRatePredictor(BaseModel):
         
         return predictions, metadata
     
-    async def _ensemble_predict(self, X: np.ndarray) -> np.ndarray:
+    def _ensemble_predict(self, X: np.ndarray) -> np.ndarray:
         """Make ensemble predictions from all models"""
         predictions = []
         
@@ -298,8 +302,8 @@ class NOIGrowthForecaster(BaseModel):
         logger.info("NOI growth model training completed", **metrics)
         return metrics
     
-    async def predict(self, future_periods: int = 12, future_features: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
-        """Forecast NOI growth for future periods"""
+    def predict_sync(self, future_periods: int = 12, future_features: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """Blocking NOI growth forecast for future periods"""
         
         # Create future dataframe
         future = self.prophet_model.make_future_dataframe(periods=future_periods, freq='M')
@@ -331,6 +335,7 @@ class ArbitrageScorer(BaseModel):
         super().__init__("arbitrage_scorer", "1.3")
         self.scoring_model = None
         self.percentile_thresholds = {}
+        self.score_range = None  # (min, max) raw training score, for 0-100 scaling
     
     async def train(self, X: np.ndarray, y: np.ndarray, **kwargs) -> Dict[str, float]:
         """Train arbitrage scoring model"""
@@ -360,6 +365,7 @@ class ArbitrageScorer(BaseModel):
             "50th": np.percentile(train_scores, 50),
             "25th": np.percentile(train_scores, 25)
         }
+        self.score_range = (float(np.min(train_scores)), float(np.max(train_scores)))
         
         # Performance metrics
         mae = np.mean(np.abs(train_scores - y))
@@ -384,8 +390,8 @@ class ArbitrageScorer(BaseModel):
         logger.info("Arbitrage scoring model training completed", **metrics)
         return metrics
     
-    async def predict(self, X: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
-        """Score arbitrage opportunities"""
+    def predict_sync(self, X: np.ndarray) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Blocking arbitrage scoring"""
         
         raw_scores = self.scoring_model.predict(X)
         
@@ -399,8 +405,12 @@ class ArbitrageScorer(BaseModel):
                     break
             percentile_scores[i] = percentile
         
-        # Scale to 0-100
-        scaled_scores = (raw_scores - np.min(raw_scores)) / (np.max(raw_scores) - np.min(raw_scores)) * 100
+        # Scale to 0-100 against the training range so a row's score does not depend on
+        # which other rows share the batch (older pickles fall back to the batch range)
+        score_min, score_max = getattr(self, "score_range", None) or (np.min(raw_scores), np.max(raw_scores))
+        scaled_scores = np.clip(
+            (raw_scores - score_min) / max(score_max - score_min, 1e-12) * 100, 0.0, 100.0
+        )
         
         metadata = {
             "model_name": self.model_name,
@@ -423,9 +433,9 @@ class ModelRegistry:
     async def initialize(self):
         """Initialize MLflow model registry"""
         try:
-            mlflow.set_tracking_uri(settings.mlflow_tracking_uri)
+            mlflow.set_tracking_uri(get_settings().mlflow_tracking_uri)
             self.mlflow_client = mlflow.tracking.MlflowClient()
-            logger.info("Model registry initialized", tracking_uri=settings.mlflow_tracking_uri)
+            logger.info("Model registry initialized", tracking_uri=get_settings().mlflow_tracking_uri)
         except Exception as e:
             logger.error("Failed to initialize model registry", error=str(e))
             # Fallback to local file-based registry
@@ -10,7 +10,7 @@ from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
 from enum import Enum
 
-from ..core.config import settings, ACCURACY_ALERTS, FRESHNESS_ALERTS
+from ..core.config import get_settings, get_accuracy_alerts, get_freshness_alerts
 from ..core.utils import logger, METRICS, HealthCheck, calculate_data_freshness_score
 
 # Mock imports
@@ -22,6 +22,11 @@ except ImportError:
     pass
 
 
+# Probes hit every pod every few seconds; serve the last full check for this long
+HEALTH_CACHE_TTL_SECONDS = 2.0
+READINESS_CACHE_TTL_SECONDS = 10.0
+
+
 class HealthStatus(str, Enum):
     HEALTHY = "healthy"
     DEGRADED = "degraded"
@@ -71,11 +76,12 @@ class AccuracyMonitor:
         """Record accuracy metric and check for SLA breaches"""
         
         # Get threshold for metric
+        accuracy_alerts = get_accuracy_alerts()
         threshold_map = {
-            "caprate_mae_bps": ACCURACY_ALERTS["caprate_mae_breach"],
-            "noi_mape_percent": ACCURACY_ALERTS["noi_mape_breach"],
-            "arbitrage_top_decile_precision": settings.accuracy_targets.arbitrage_top_decile_precision,
-            "confidence_calibration": ACCURACY_ALERTS["confidence_miscalibration"]
+            "caprate_mae_bps": accuracy_alerts["caprate_mae_breach"],
+            "noi_mape_percent": accuracy_alerts["noi_mape_breach"],
+            "arbitrage_top_decile_precision": get_settings().accuracy_targets.arbitrage_top_decile_precision,
+            "confidence_calibration": accuracy_alerts["confidence_miscalibration"]
         }
         
         threshold = threshold_map.get(metric_name, 0.0)
@@ -196,11 +202,13 @@ class FreshnessMonitor:
         freshness_metrics = []
         
         # Define data sources and their SLA thresholds
+        freshness_alerts = get_freshness_alerts()
+        freshness_targets = get_settings().freshness_targets
         sources_config = {
-            "treasury_rates": FRESHNESS_ALERTS["treasury_stale_minutes"] * 60,
-            "mortgage_pricing": FRESHNESS_ALERTS["mortgage_stale_minutes"] * 60,
-            "mobility_data": settings.freshness_targets.daily_signals_hours * 3600,
-            "news_sentiment": settings.freshness_targets.news_sentiment_minutes * 60
+            "treasury_rates": freshness_alerts["treasury_stale_minutes"] * 60,
+            "mortgage_pricing": freshness_alerts["mortgage_stale_minutes"] * 60,
+            "mobility_data": freshness_targets.daily_signals_hours * 3600,
+            "news_sentiment": freshness_targets.news_sentiment_minutes * 60
         }
         
         for source_name, threshold_seconds in sources_config.items():
@@ -399,6 +407,9 @@ class HealthChecker:
         self.start_time = datetime.now(timezone.utc)
         self.last_health_check = None
         self.background_task = None
+        self._cached_health: Optional[HealthCheck] = None
+        self._cached_health_at = 0.0
+        self._health_lock = asyncio.Lock()
     
     async def initialize(self):
         """Initialize health monitoring"""
@@ -409,7 +420,29 @@ class HealthChecker:
         
         logger.info("Health monitoring system initialized")
     
-    async def check_health(self) -> HealthCheck:
+    def check_liveness(self) -> Dict[str, Any]:
+        """Cheap liveness report: the process is up and serving"""
+        return {
+            "status": "alive",
+            "uptime_seconds": (datetime.now(timezone.utc) - self.start_time).total_seconds()
+        }
+    
+    async def check_health(self, max_age_seconds: float = HEALTH_CACHE_TTL_SECONDS) -> HealthCheck:
+        """Return a comprehensive health check no older than max_age_seconds
+        
+        Concurrent callers that find the cached result stale share one fresh check.
+        """
+        if self._cached_health is not None and time.monotonic() - self._cached_health_at < max_age_seconds:
+            return self._cached_health
+        
+        async with self._health_lock:
+            # Another caller may have refreshed it while we waited
+            if self._cached_health is None or time.monotonic() - self._cached_health_at >= max_age_seconds:
+                self._cached_health = await self._run_health_check()
+                self._cached_health_at = time.monotonic()
+            return self._cached_health
+    
+    async def _run_health_check(self) -> HealthCheck:
         """Perform comprehensive health check"""
         check_start = datetime.now(timezone.utc)
         uptime = (check_start - self.start_time).total_seconds()
@@ -174,6 +174,16 @@ class TestAPIEndpoints:
         assert "status" in data
         assert data["status"] in ["healthy", "degraded", "unhealthy"]
     
+    def test_health_probe_endpoints(self, client):
+        """Test liveness and readiness probe endpoints"""
+        response = client.get("/health/live")
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+        
+        response = client.get("/health/ready")
+        assert response.status_code in [200, 503]
+        assert response.json()["status"] in ["healthy", "degraded", "unhealthy"]
+    
     def test_metrics_endpoint(self, client):
         """Test Prometheus metrics endpoint"""
         response = client.get("/metrics")
@@ -329,6 +339,16 @@ class TestDataFreshness:
             assert hasattr(metric, 'age_seconds') 
             assert hasattr(metric, 'is_stale')
             assert metric.age_seconds >= 0
+    
+    @pytest.mark.asyncio
+    async def test_health_check_is_cached(self, health_checker):
+        """Test repeated health checks within the TTL reuse one result"""
+        first = await health_checker.check_health()
+        second = await health_checker.check_health()
+        assert second is first
+        
+        fresh = await health_checker.check_health(max_age_seconds=0)
+        assert fresh is not first
 
 
 class TestSystemIntegration:
@@ -368,6 +388,110 @@ class TestSystemIntegration:
         assert len(predictions) == 1
         assert 0.02 < predictions[0] < 0.12
         assert metadata["model_name"] == "caprate_predictor"
+    
+    @pytest.mark.asyncio
+    async def test_vectorized_batch_isolates_failures(self, monkeypatch):
+        """A failing fused model call falls back per property, so only the bad property fails"""
+        from capsight.api.endpoints import PropertyRequest
+        
+        class FusedCallFails:
+            async def predict(self, X, include_uncertainty=False):
+                if len(X) > 1:
+                    raise RuntimeError("fused call failed")
+                return np.full(len(X), 0.055), {}
+        
+        await prediction_service.initialize()
+        await prediction_service.stop_batchers()
+        monkeypatch.setitem(prediction_service.models, "caprate_predictor", FusedCallFails())
+        monkeypatch.setattr(prediction_service, "_caprate_batcher", None)
+        
+        predict_uncached = prediction_service._predict_uncached
+        
+        async def one_bad_property(request):
+            if request.property_id == "isolation_2":
+                raise RuntimeError("bad property")
+            return await predict_uncached(request)
+        
+        monkeypatch.setattr(prediction_service, "_predict_uncached", one_bad_property)
+        
+        requests = [PropertyRequest(property_id=f"isolation_{i}", market_id="test_market") for i in range(4)]
+        results = await prediction_service.predict_batch_vectorized(requests)
+        
+        assert [isinstance(result, Exception) for result in results] == [False, False, True, False]
+        assert results[0].property_id == "isolation_0"
+    
+    @pytest.mark.asyncio
+    async def test_inference_batcher_stop_fails_pending_requests(self):
+        """Stopping the batcher fails the in-flight batch and the queued rows instead of hanging them"""
+        from capsight.api.endpoints import _InferenceBatcher
+        
+        release = asyncio.Event()
+        
+        class BlockingModel:
+            async def predict(self, X):
+                await release.wait()
+                return np.zeros(len(X)), {}
+        
+        batcher = _InferenceBatcher(BlockingModel(), max_batch_size=1, max_latency_ms=0)
+        in_flight = asyncio.create_task(batcher.submit(np.zeros((1, 20))))
+        queued = asyncio.create_task(batcher.submit(np.zeros((1, 20))))
+        await asyncio.sleep(0.01)
+        
+        await batcher.stop()
+        
+        for task in (in_flight, queued):
+            with pytest.raises(RuntimeError, match="stopped"):
+                await asyncio.wait_for(task, timeout=1)
+        
+        # A restarted loop serves new rows normally
+        release.set()
+        predictions, _ = await asyncio.wait_for(batcher.submit(np.zeros((1, 20))), timeout=1)
+        assert predictions.shape == (1,)
+        await batcher.stop()
+    
+    @pytest.mark.asyncio
+    async def test_send_batch_sends_oversized_messages_alone(self):
+        """A message too large for an empty batch is sent on its own instead of being dropped"""
+        from capsight.ingestion.streams import StreamingIngestionService
+        
+        class SizedBatch:
+            def __init__(self, capacity=200):
+                self.capacity = capacity
+                self.values = []
+            
+            def append(self, key, value, timestamp):
+                if sum(map(len, self.values)) + len(value) > self.capacity:
+                    return None
+                self.values.append(value)
+                return object()
+            
+            def record_count(self):
+                return len(self.values)
+        
+        class RecordingProducer:
+            def __init__(self):
+                self.sent = []
+            
+            def create_batch(self):
+                return SizedBatch()
+            
+            async def send_batch(self, batch, topic, partition):
+                self.sent.append(("batch", batch.record_count()))
+            
+            async def send(self, topic, message):
+                self.sent.append(("single", message["i"]))
+        
+        service = StreamingIngestionService()
+        service.producer = RecordingProducer()
+        messages = (
+            [{"i": 0, "payload": "x" * 300}]
+            + [{"i": i, "payload": "x" * 10} for i in range(1, 5)]
+            + [{"i": 5, "payload": "y" * 500}, {"i": 6}]
+        )
+        
+        await service._send_batch("market_data", messages)
+        
+        assert service.producer.sent == [("single", 0), ("batch", 4), ("single", 5), ("batch", 1)]
 
 
 class TestPerformanceAndLatency:
@@ -4,6 +4,7 @@ Production ASGI application for deployment
 """
 
 import asyncio
+import sys
 from contextlib import asynccontextmanager
 
 from capsight import app, prediction_service, logger
@@ -68,5 +69,8 @@ if __name__ == "__main__":
         port=8000,
         reload=False,  # Set to False for production
         workers=1,     # Use multiple workers for production
+        # uvloop has no Windows build; fall back to the stdlib loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
         log_config=None  # Use our structured logging
     )